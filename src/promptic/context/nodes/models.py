@@ -5,7 +5,7 @@ from __future__ import annotations
 from typing import Any, Literal, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class NetworkConfig(BaseModel):
@@ -14,11 +14,21 @@ class NetworkConfig(BaseModel):
     # AICODE-NOTE: Token counting removed - not used in examples 003-006.
     # Removed fields: max_tokens_per_node, max_tokens_per_network, token_model.
     # Network building now focuses on size and depth limits only.
+
+    # AICODE-NOTE: Frozen so one instance (including the builder's shared default)
+    # can be reused across builds without defensive copies.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     max_depth: int = Field(default=10, ge=1, description="Maximum depth limit")
     max_node_size: int = Field(
-        default=10 * 1024 * 1024, ge=1, description="Maximum size per node in bytes (default 10MB)"
+        default=10 * 1024 * 1024,
+        ge=1,
+        description=(
+            "Maximum size per node in bytes (default 10MB), measured as the UTF-8 length "
+            "of the node content serialized as compact JSON"
+        ),
     )
     max_network_size: int = Field(
         default=1000, ge=1, description="Maximum number of nodes in network"
@@ -84,5 +94,9 @@ class NodeNetwork(BaseModel):
     nodes: dict[str, ContextNode] = Field(
         default_factory=dict, description="All nodes in the network by ID"
     )
-    total_size: int = Field(default=0, ge=0, description="Total size of all nodes in bytes")
+    total_size: int = Field(
+        default=0,
+        ge=0,
+        description="Total size of all nodes in bytes (sum of their compact JSON content sizes)",
+    )
     depth: int = Field(default=0, ge=0, description="Maximum depth of the network")
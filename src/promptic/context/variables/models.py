@@ -24,7 +24,7 @@ class VariableScope(str, Enum):
     PATH = "path"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SubstitutionContext:
     """Context for variable substitution in a node.
 
@@ -39,6 +39,9 @@ class SubstitutionContext:
         content: Content string to perform variable substitution on
         format: File format identifier (markdown, yaml, json, jinja2)
         variables: Dictionary of variable names to values for substitution
+
+    # AICODE-NOTE: One context is built per substituted string, so the dataclass uses
+    # __slots__ (no per-instance __dict__) and is frozen - contexts are never mutated.
     """
 
     node_id: str
@@ -3,10 +3,39 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from typing import Any
 
 from promptic.context.variables.models import VariableScope
 
+# AICODE-NOTE: Variable names must be valid identifiers: letters, numbers, underscores
+# No spaces or special characters except underscore. Used with fullmatch, so a trailing
+# newline is rejected too (a "$" anchor would accept "name\n").
+_VARIABLE_NAME_PATTERN = re.compile(r"[a-zA-Z_][a-zA-Z0-9_]*")
+
+
+@lru_cache(maxsize=4096)
+def _parse_variable_name(var_key: str) -> tuple[VariableScope, str, str | None]:
+    """Parse a variable key into (scope, variable name, path or node); see parse_variable_name.
+
+    # AICODE-NOTE: Variables are resolved once per rendered node, so the same keys are
+    # parsed over and over. The result depends only on the key and is an immutable tuple,
+    # so it is cached at module level (not per resolver instance).
+    """
+    parts = var_key.split(".")
+
+    if len(parts) == 1:
+        # Simple scope: "var"
+        return (VariableScope.SIMPLE, parts[0], None)
+    elif len(parts) == 2:
+        # Node scope: "node.var"
+        return (VariableScope.NODE, parts[1], parts[0])
+    else:
+        # Path scope: "root.group.node.var" (3+ parts)
+        variable_name = parts[-1]
+        path = ".".join(parts[:-1])
+        return (VariableScope.PATH, variable_name, path)
+
 
 class ScopeResolver:
     """Resolves variable scopes and matches variables to nodes.
@@ -20,12 +49,6 @@ class ScopeResolver:
     # Within the same scope, the first matching variable definition is used.
     """
 
-    def __init__(self) -> None:
-        """Initialize scope resolver with variable name pattern."""
-        # AICODE-NOTE: Variable names must be valid identifiers: letters, numbers, underscores
-        # No spaces or special characters except underscore
-        self._var_name_pattern = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_]*$")
-
     def parse_variable_name(self, var_key: str) -> tuple[VariableScope, str, str | None]:
         """Parse a variable key into scope, variable name, and optional path/node.
 
@@ -47,19 +70,7 @@ class ScopeResolver:
             >>> resolver.parse_variable_name("root.group.node.var")
             (VariableScope.PATH, "var", "root.group.node")
         """
-        parts = var_key.split(".")
-
-        if len(parts) == 1:
-            # Simple scope: "var"
-            return (VariableScope.SIMPLE, parts[0], None)
-        elif len(parts) == 2:
-            # Node scope: "node.var"
-            return (VariableScope.NODE, parts[1], parts[0])
-        else:
-            # Path scope: "root.group.node.var" (3+ parts)
-            variable_name = parts[-1]
-            path = ".".join(parts[:-1])
-            return (VariableScope.PATH, variable_name, path)
+        return _parse_variable_name(var_key)
 
     def matches_node(
         self,
@@ -198,4 +209,4 @@ class ScopeResolver:
         # - No spaces or special characters (except underscore)
         # - Case sensitive
         """
-        return bool(self._var_name_pattern.match(var_name))
+        return _VARIABLE_NAME_PATTERN.fullmatch(var_name) is not None
@@ -3,11 +3,36 @@
 from __future__ import annotations
 
 import re
-from typing import Any
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 
 from promptic.context.variables.models import SubstitutionContext
 from promptic.context.variables.resolver import ScopeResolver
 
+if TYPE_CHECKING:
+    from jinja2 import Environment, Template
+
+
+@lru_cache(maxsize=1)
+def _jinja2_environment() -> Environment:
+    """Return the shared Jinja2 environment used for variable substitution."""
+    from jinja2 import DebugUndefined, Environment
+
+    return Environment(undefined=DebugUndefined, auto_reload=False)
+
+
+@lru_cache(maxsize=256)
+def _compile_jinja2_template(content: str) -> Template:
+    """Compile Jinja2 template source, reusing compiled templates for repeated content.
+
+    # AICODE-NOTE: Template(content) re-runs the Jinja2 lexer, parser and code
+    # generator on every call. The same node content is substituted on every render
+    # (and once per node in a network), so compiled templates are cached by source.
+    # Templates keep no render state, so sharing them is safe. The environment uses
+    # auto_reload=False because there is no loader to watch for changes.
+    """
+    return _jinja2_environment().from_string(content)
+
 
 class VariableSubstitutor:
     """Service for performing variable substitution in node content.
@@ -25,15 +50,16 @@ class VariableSubstitutor:
     # - Markers are replaced with string values (no type preservation)
     """
 
+    # AICODE-NOTE: Variable marker pattern for non-Jinja2 formats
+    # Matches {{variable_name}} where variable_name is a valid identifier
+    # No spaces allowed inside the braces
+    # Compiled once per class: a substitutor is created per render/export call.
+    _MARKER_PATTERN = re.compile(r"\{\{([a-zA-Z_][a-zA-Z0-9_]*)\}\}")
+
     def __init__(self) -> None:
         """Initialize variable substitutor with scope resolver."""
         self.resolver = ScopeResolver()
 
-        # AICODE-NOTE: Variable marker pattern for non-Jinja2 formats
-        # Matches {{variable_name}} where variable_name is a valid identifier
-        # No spaces allowed inside the braces
-        self._marker_pattern = re.compile(r"\{\{([a-zA-Z_][a-zA-Z0-9_]*)\}\}")
-
     def substitute(self, context: SubstitutionContext) -> str:
         """Perform variable substitution in the given context.
 
@@ -61,15 +87,33 @@ class VariableSubstitutor:
             context.hierarchical_path,
         )
 
+        return self.substitute_resolved(context.content, context.format, node_variables)
+
+    def substitute_resolved(self, content: str, format: str, node_variables: dict[str, Any]) -> str:
+        """Substitute variables that were already resolved for a node.
+
+        Args:
+            content: Content to substitute into
+            format: Node format ("jinja2" uses the Jinja2 engine, others use markers)
+            node_variables: Variables resolved for the node by
+                ScopeResolver.resolve_variables_for_node()
+
+        Returns:
+            Content with variables substituted
+
+        # AICODE-NOTE: Scope resolution parses every variable key, so callers that
+        # substitute many strings of the same node (structured content) resolve the
+        # node's variables once and call this method for each string.
+        """
         if not node_variables:
             # No variables apply to this node
-            return context.content
+            return content
 
         # Route to format-specific substitution
-        if context.format == "jinja2":
-            return self._substitute_jinja2(context.content, node_variables)
+        if format == "jinja2":
+            return self._substitute_jinja2(content, node_variables)
         else:
-            return self._substitute_markers(context.content, node_variables)
+            return self._substitute_markers(content, node_variables)
 
     def _substitute_markers(self, content: str, variables: dict[str, Any]) -> str:
         """Substitute {{variable}} markers in content.
@@ -87,7 +131,11 @@ class VariableSubstitutor:
         # - If found, replace with string value
         # - If not found, leave marker unchanged (graceful degradation)
         # - All values are converted to strings (no type preservation)
+        # - All markers are replaced in a single re.sub pass over the content;
+        #   content without "{{" skips the regex scan entirely
         """
+        if "{{" not in content:
+            return content
 
         def replace_marker(match: re.Match[str]) -> str:
             var_name = match.group(1)
@@ -99,7 +147,7 @@ class VariableSubstitutor:
                 # Variable not defined, keep marker unchanged
                 return match.group(0)
 
-        return str(self._marker_pattern.sub(replace_marker, content))
+        return str(self._MARKER_PATTERN.sub(replace_marker, content))
 
     def _substitute_jinja2(self, content: str, variables: dict[str, Any]) -> str:
         """Substitute variables in Jinja2 template using Jinja2 engine.
@@ -117,14 +165,19 @@ class VariableSubstitutor:
         # - Jinja2 handles variable syntax {{ var }}, filters, control structures
         # - Undefined variables raise error by default (can configure for graceful handling)
         # - Type preservation works correctly (Jinja2 handles it natively)
+        # - Content without "{" holds no Jinja2 delimiters and is returned without
+        #   compiling; the only change Jinja2 would make is dropping one trailing
+        #   newline (keep_trailing_newline=False), which the fast path mirrors. "\r"
+        #   content still goes through Jinja2, which normalizes newlines.
         """
-        try:
-            from jinja2 import DebugUndefined, Template
+        if "{" not in content and "\r" not in content:
+            return content[:-1] if content.endswith("\n") else content
 
+        try:
             # AICODE-NOTE: Using DebugUndefined to gracefully handle missing variables
             # Undefined variables are rendered as empty strings with debug info
             # This matches the graceful degradation behavior of marker substitution
-            template = Template(content, undefined=DebugUndefined)
+            template = _compile_jinja2_template(content)
             return str(template.render(**variables))
         except ImportError as e:
             # AICODE-NOTE: Jinja2 should always be available (it's in dependencies)
@@ -19,6 +19,11 @@ class Jinja2Parser(FormatParser):
     that are extracted during reference extraction.
     """
 
+    # Look for file references in comments {# ref: path/to/file.md #}
+    _REF_COMMENT_PATTERN = re.compile(r"\{\#\s*ref:\s*([^\#]+)\s*\#\}", re.IGNORECASE)
+    # Look for references in variables {{ include('path/to/file.md') }}
+    _INCLUDE_PATTERN = re.compile(r"include\(['\"]([^'\"]+)['\"]\)", re.IGNORECASE)
+
     def detect(self, content: str, path: Path) -> bool:
         """Detect if content is Jinja2 format based on file extension."""
         return path.suffix.lower() in {".jinja", ".jinja2"}
@@ -56,17 +61,13 @@ class Jinja2Parser(FormatParser):
         references = []
         raw_content = parsed.get("raw_content", "")
 
-        # Look for file references in comments {# ref: path/to/file.md #}
-        ref_comment_pattern = re.compile(r"\{\#\s*ref:\s*([^\#]+)\s*\#\}", re.IGNORECASE)
-        comment_matches = ref_comment_pattern.findall(raw_content)
+        comment_matches = self._REF_COMMENT_PATTERN.findall(raw_content)
         for match in comment_matches:
             path = match.strip()
             if path and not path.startswith(("http://", "https://")):
                 references.append(NodeReference(path=path, type="file", label=None))
 
-        # Look for references in variables {{ include('path/to/file.md') }}
-        include_pattern = re.compile(r"include\(['\"]([^'\"]+)['\"]\)", re.IGNORECASE)
-        include_matches = include_pattern.findall(raw_content)
+        include_matches = self._INCLUDE_PATTERN.findall(raw_content)
         for match in include_matches:
             path = match.strip()
             if path and not path.startswith(("http://", "https://")):
@@ -3,13 +3,19 @@
 from __future__ import annotations
 
 import json
+import re
 from pathlib import Path
 from typing import Any
 
+import orjson
+
 from promptic.context.nodes.errors import FormatParseError, JSONConversionError
 from promptic.context.nodes.models import NodeReference
 from promptic.format_parsers.base import FormatParser
 
+# Integers of 19+ digits may not fit in 64 bits, which orjson decodes as lossy floats.
+_LONG_DIGIT_RUN = re.compile(r"\d{19,}")
+
 
 class JSONParser(FormatParser):
     """Parser for JSON format files.
@@ -24,9 +30,22 @@ class JSONParser(FormatParser):
         return path.suffix.lower() == ".json"
 
     def parse(self, content: str, path: Path) -> dict[str, Any]:
-        """Parse JSON content into structured dictionary."""
+        """Parse JSON content into structured dictionary.
+
+        # AICODE-NOTE: orjson (already a core dependency) is used instead of the
+        # stdlib json module for C-level decoding. It is stricter than json, so
+        # content it rejects (NaN / Infinity literals) is retried with json.loads,
+        # and content with integers that may exceed 64 bits goes straight to
+        # json.loads to keep them exact.
+        """
         try:
-            parsed = json.loads(content)
+            if _LONG_DIGIT_RUN.search(content):
+                parsed = json.loads(content)
+            else:
+                try:
+                    parsed = orjson.loads(content)
+                except orjson.JSONDecodeError:
+                    parsed = json.loads(content)
             if parsed is None:
                 return {}
             if not isinstance(parsed, dict):
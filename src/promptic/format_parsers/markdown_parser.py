@@ -19,6 +19,9 @@ class MarkdownParser(FormatParser):
     stored as text and metadata extracted from headings and structure.
     """
 
+    # Matches markdown links [label](path)
+    _LINK_PATTERN = re.compile(r"\[([^\]]+)\]\(([^)]+)\)")
+
     def detect(self, content: str, path: Path) -> bool:
         """Detect if content is Markdown format based on file extension."""
         return path.suffix.lower() in {".md", ".markdown"}
@@ -54,11 +57,10 @@ class MarkdownParser(FormatParser):
         Recognizes Markdown link syntax: [label](path/to/file.md)
         """
         references = []
-        link_pattern = re.compile(r"\[([^\]]+)\]\(([^)]+)\)")
 
         # Extract from raw_content if available
         raw_content = parsed.get("raw_content", "")
-        matches = link_pattern.findall(raw_content)
+        matches = self._LINK_PATTERN.findall(raw_content)
 
         for label, path in matches:
             # Only include file references (not URLs)
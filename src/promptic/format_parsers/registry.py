@@ -29,6 +29,17 @@ class FormatParserRegistry:
         """Initialize registry with default parsers."""
         self._parsers: dict[str, FormatParser] = {}
         self._extensions: dict[str, str] = {}
+        self._extension_parsers: dict[str, tuple[str, FormatParser]] = {}
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        """Counter bumped by every register() call.
+
+        # AICODE-NOTE: Callers caching parse results (load_node) include it in their
+        # cache key, so registering or replacing a parser invalidates earlier parses.
+        """
+        return self._generation
 
     def register(self, format_name: str, parser: FormatParser, extensions: list[str]) -> None:
         """Register a parser for a format.
@@ -42,6 +53,12 @@ class FormatParserRegistry:
         for ext in extensions:
             self._extensions[ext.lower()] = format_name
 
+        # Keep the extension -> parser table in sync (re-registration replaces parsers)
+        for ext, ext_format in self._extensions.items():
+            if ext_format == format_name:
+                self._extension_parsers[ext] = (format_name, parser)
+        self._generation += 1
+
     def detect_format(self, content: str, path: Path) -> str:
         """Detect format from content and path.
 
@@ -57,22 +74,39 @@ class FormatParserRegistry:
         Returns:
             Format name (e.g., "yaml", "markdown")
 
+        Raises:
+            FormatDetectionError: If format cannot be detected
+        """
+        return self.detect_parser(content, path)[0]
+
+    def detect_parser(self, content: str, path: Path) -> tuple[str, FormatParser]:
+        """Detect format and return it together with its parser.
+
+        # AICODE-NOTE: Extension hits resolve through a single precomputed
+        extension -> (format, parser) lookup, so callers such as load_node() do not
+        need a second get_parser() call. Walking every registered parser only
+        happens when the extension is unknown or its parser rejects the content.
+
+        Args:
+            content: File content as string
+            path: File path for extension-based detection
+
+        Returns:
+            Tuple of (format name, parser instance)
+
         Raises:
             FormatDetectionError: If format cannot be detected
         """
         # Try extension-based detection first
-        ext = path.suffix.lower()
-        if ext in self._extensions:
-            format_name = self._extensions[ext]
-            # Verify parser can detect this content
-            parser = self._parsers[format_name]
-            if parser.detect(content, path):
-                return format_name
+        entry = self._extension_parsers.get(path.suffix.lower())
+        if entry is not None and entry[1].detect(content, path):
+            # Verified: parser accepts this content
+            return entry
 
         # Fallback to content-based detection
         for format_name, parser in self._parsers.items():
             if parser.detect(content, path):
-                return format_name
+                return format_name, parser
 
         raise FormatDetectionError(f"Could not detect format for {path}")
 
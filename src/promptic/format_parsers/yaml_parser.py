@@ -16,6 +16,11 @@ from promptic.context.nodes.errors import (
 from promptic.context.nodes.models import NodeReference
 from promptic.format_parsers.base import FormatParser
 
+# AICODE-NOTE: PyYAML's pure-Python SafeLoader scans and composes documents in Python;
+# CSafeLoader runs the same safe schema on top of libyaml. It is only present when
+# PyYAML was built with libyaml, so fall back to SafeLoader otherwise.
+_SAFE_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class YAMLParser(FormatParser):
     """Parser for YAML format files.
@@ -25,6 +30,9 @@ class YAMLParser(FormatParser):
     YAML content is parsed and converted to JSON as the canonical internal representation.
     """
 
+    # Matches "$ref: path" inside string values
+    _REF_PATTERN = re.compile(r"\$ref:\s*(.+)", re.IGNORECASE)
+
     def detect(self, content: str, path: Path) -> bool:
         """Detect if content is YAML format based on file extension.
 
@@ -57,7 +65,7 @@ class YAMLParser(FormatParser):
     def parse(self, content: str, path: Path) -> dict[str, Any]:
         """Parse YAML content into structured dictionary.
 
-        Uses yaml.safe_load() for safe YAML parsing. Handles edge cases:
+        Uses the safe YAML loader (libyaml-backed when available) for parsing. Handles edge cases:
         - Empty/null content returns empty dict
         - Non-dict content (scalars, lists) wrapped in dict with "content" key
         - Preserves YAML structure including nested dicts and lists
@@ -85,7 +93,7 @@ class YAMLParser(FormatParser):
             >>> assert parsed["value"] == 42
         """
         try:
-            parsed = yaml.safe_load(content)
+            parsed = yaml.load(content, Loader=_SAFE_LOADER)
             if parsed is None:
                 return {}
             if not isinstance(parsed, dict):
@@ -166,7 +174,7 @@ class YAMLParser(FormatParser):
             >>> assert refs[0].path == "instructions/analyze.md"
         """
         references = []
-        ref_pattern = re.compile(r"\$ref:\s*(.+)", re.IGNORECASE)
+        ref_pattern = self._REF_PATTERN
 
         def extract_from_value(value: Any) -> None:
             """Recursively extract references from YAML structure."""
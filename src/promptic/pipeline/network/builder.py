@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Any, Iterator, Optional, TypeGuard
+
+import orjson
 
 from promptic.context.nodes.errors import (
     NodeNetworkDepthExceededError,
@@ -12,7 +14,7 @@ from promptic.context.nodes.errors import (
     NodeResourceLimitExceededError,
     PathResolutionError,
 )
-from promptic.context.nodes.models import ContextNode, NetworkConfig, NodeNetwork
+from promptic.context.nodes.models import ContextNode, NetworkConfig, NodeNetwork, NodeReference
 from promptic.format_parsers.registry import get_default_registry
 from promptic.resolvers.base import NodeReferenceResolver
 from promptic.resolvers.filesystem import FilesystemReferenceResolver
@@ -21,12 +23,57 @@ from promptic.versioning import VersionSpec
 # AICODE-NOTE: Token counting removed - not used in examples 003-006.
 # Removed import: from promptic.token_counting.base import TokenCounter
 
+# DFS colors for network traversal (values stored in a bytearray indexed by node index)
+_ON_PATH = 1
+_DONE = 2
+
+# Shared default limits (NetworkConfig is frozen, so one instance serves every build)
+_DEFAULT_NETWORK_CONFIG = NetworkConfig()
+
+
+def _content_size(content: dict[str, Any]) -> int:
+    """Return the size in bytes of a node's content serialized as compact JSON.
+
+    # AICODE-NOTE: Content is the canonical JSON form of a node, so its size is measured
+    # on the orjson serialization (C-level, emits UTF-8 bytes directly) rather than on
+    # Python's str() repr followed by a separate encode. OPT_NON_STR_KEYS covers YAML
+    # mappings with int/bool keys; content orjson cannot serialize at all falls back to
+    # the UTF-8 length of its repr. Compact JSON is shorter than the repr measure used
+    # before, so NetworkConfig.max_node_size documents which size it limits.
+    """
+    try:
+        return len(orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS))
+    except orjson.JSONEncodeError:
+        return len(str(content).encode("utf-8"))
+
+
+def _supports_try_resolve(
+    resolver: NodeReferenceResolver,
+) -> TypeGuard[FilesystemReferenceResolver]:
+    """Return whether a resolver can validate and load a reference in one try_resolve() call.
+
+    # AICODE-NOTE: try_resolve() bypasses validate() and resolve(), so subclasses that
+    # override either of them keep going through the public two-step path.
+    """
+    if not isinstance(resolver, FilesystemReferenceResolver):
+        return False
+    resolver_type = type(resolver)
+    return (
+        resolver_type.validate is FilesystemReferenceResolver.validate
+        and resolver_type.resolve is FilesystemReferenceResolver.resolve
+    )
+
+
+def _child_ids(node: ContextNode) -> set[str]:
+    """Return IDs of children already linked to a node (empty for freshly loaded nodes)."""
+    return {str(child.id) for child in node.children}
+
 
 class NodeNetworkBuilder:
     """Orchestrates loading multiple nodes, resolving references, and constructing the network graph.
 
     # AICODE-NOTE: This class implements network building with cycle detection using DFS algorithm.
-    The algorithm maintains a visited set and recursion stack to detect cycles efficiently.
+    The traversal is iterative and tracks per-node DFS colors to detect cycles efficiently.
     Depth limits are enforced during traversal to prevent stack overflow from extremely deep trees.
     Reference validation ensures all references resolve to existing nodes before network construction.
     """
@@ -131,7 +178,7 @@ class NodeNetworkBuilder:
             Network has 5 nodes
         """
         if config is None:
-            config = NetworkConfig()
+            config = _DEFAULT_NETWORK_CONFIG
 
         # Resolve root path with version if provided
         root_node_path = root_path
@@ -155,51 +202,20 @@ class NodeNetworkBuilder:
 
         # Build network starting from root
         nodes: dict[str, ContextNode] = {}
-        visited: set[str] = set()
-        recursion_stack: set[str] = set()
 
         # Determine network root for relative path resolution
         network_root = root_path.parent if root_path.is_file() else root_path
 
-        # Traverse network and build node dictionary
-        self._build_network_recursive(
+        # Traverse network, build node dictionary, enforce resource limits and
+        # measure depth and size in one pass
+        network_depth, total_size = self._build_network_iterative(
             root_node,
             network_root,  # Use network root for all relative path resolution
-            network_root,  # Pass network root separately to maintain it through recursion
             nodes,
-            visited,
-            recursion_stack,
             config,
             version,  # Pass version for version-aware reference resolution
-            depth=0,
         )
 
-        # Calculate network metrics
-        total_size = sum(len(str(node.content).encode("utf-8")) for node in nodes.values())
-
-        # Check per-node size limits
-        for node in nodes.values():
-            node_size = len(str(node.content).encode("utf-8"))
-            if node_size > config.max_node_size:
-                raise NodeResourceLimitExceededError(
-                    f"Node {node.id} exceeds size limit: {node_size} > {config.max_node_size}",
-                    limit_type="node_size",
-                    current_value=node_size,
-                    max_value=config.max_node_size,
-                )
-
-        # Check network size limit
-        if len(nodes) > config.max_network_size:
-            raise NodeResourceLimitExceededError(
-                f"Network size exceeds limit: {len(nodes)} > {config.max_network_size}",
-                limit_type="network_size",
-                current_value=len(nodes),
-                max_value=config.max_network_size,
-            )
-
-        # Calculate depth
-        network_depth = self._calculate_depth(root_node, nodes)
-
         # Create network
         network = NodeNetwork(
             root=root_node,
@@ -210,157 +226,232 @@ class NodeNetworkBuilder:
 
         return network
 
-    def _build_network_recursive(
+    def _check_node_limits(self, node: ContextNode, node_count: int, config: NetworkConfig) -> int:
+        """Check resource limits for a newly visited node and return its size.
+
+        Args:
+            node: Node just added to the network
+            node_count: Number of nodes in the network including this one
+            config: Network configuration with limits
+
+        Returns:
+            Size of the node content in bytes
+
+        Raises:
+            NodeResourceLimitExceededError: If the node exceeds config.max_node_size or
+                the network now has more than config.max_network_size nodes
+        """
+        node_size = _content_size(node.content)
+        if node_size > config.max_node_size:
+            raise NodeResourceLimitExceededError(
+                f"Node {node.id} exceeds size limit: {node_size} > {config.max_node_size}",
+                limit_type="node_size",
+                current_value=node_size,
+                max_value=config.max_node_size,
+            )
+
+        # Check network size limit
+        if node_count > config.max_network_size:
+            raise NodeResourceLimitExceededError(
+                f"Network size exceeds limit: {node_count} > {config.max_network_size}",
+                limit_type="network_size",
+                current_value=node_count,
+                max_value=config.max_network_size,
+            )
+
+        return node_size
+
+    def _build_network_iterative(
         self,
-        node: ContextNode,
-        base_path: Path,
+        root_node: ContextNode,
         network_root: Path,
         nodes: dict[str, ContextNode],
-        visited: set[str],
-        recursion_stack: set[str],
         config: NetworkConfig,
         version: Optional[VersionSpec],
-        depth: int,
-    ) -> None:
-        """Recursively build network by loading referenced nodes.
+    ) -> tuple[int, int]:
+        """Build network by loading referenced nodes with an iterative DFS.
 
         # AICODE-NOTE: Network traversal and cycle detection algorithm:
-        - Uses DFS (depth-first search) with visited set and recursion stack
-        - Visited set tracks all nodes seen during traversal
-        - Recursion stack tracks nodes in current path (for cycle detection)
-        - If a node is in recursion stack, we've found a cycle
-        - Depth limit is enforced to prevent stack overflow
-        - Relative paths are resolved relative to network_root, not base_path
+        - Uses iterative DFS with an explicit stack of (node, reference iterator, depth,
+          linked child IDs) frames, so deep networks never hit Python's recursion limit
+          and duplicate references are detected with a set lookup instead of scanning
+          node.children
+        - Node IDs are interned to indexes on first visit; a bytearray indexed by
+          node index holds the DFS color (_ON_PATH / _DONE), which is cheaper than
+          maintaining separate visited and recursion-stack sets; IDs without an
+          index have not been visited yet
+        - path lists the node IDs of the current DFS path in order; reaching an
+          _ON_PATH node means a cycle, reported as the ordered slice of path from
+          that node back to itself
+        - Depth limit is checked on every edge before the cycle check
+        - Network depth (deepest first visit, counting the root as 1) is tracked during
+          the same walk, so no separate depth pass over children is needed
+        - Resource limits are checked as each node is first visited, so an oversized
+          node or an over-limit network aborts the walk before the remaining references
+          are resolved and loaded; the node's size feeds the network total
+        - Relative paths are resolved relative to network_root
+        - Each distinct reference path is validated, resolved and loaded at most once
+          per build; repeated references (shared includes) reuse the node already in
+          the network, so every parent links the same child instance
 
         Args:
-            node: Current node being processed
-            base_path: Base path for resolving relative references (deprecated, use network_root)
+            root_node: Root node of the network
             network_root: Root directory of the network for resolving relative references
-            nodes: Dictionary of all nodes in network (by ID)
-            visited: Set of visited node IDs
-            recursion_stack: Set of node IDs in current recursion path
+            nodes: Dictionary of all nodes in network (by ID), filled in visit order
             config: Network configuration
-            depth: Current depth in network
+            version: Optional version specification for reference resolution
+
+        Returns:
+            Tuple of (maximum depth of network, total size of all nodes in bytes)
 
         Raises:
             NodeNetworkDepthExceededError: If depth limit exceeded
             NodeNetworkValidationError: If cycle detected
             NodeReferenceNotFoundError: If reference cannot be resolved
+            NodeResourceLimitExceededError: If a node or network resource limit is exceeded
         """
-        node_id = str(node.id)
-
-        # Check depth limit
-        if depth > config.max_depth:
-            raise NodeNetworkDepthExceededError(
-                f"Network depth {depth} exceeds maximum depth {config.max_depth}"
-            )
-
-        # Check for cycles (node in recursion stack)
-        if node_id in recursion_stack:
-            # Build cycle path for error message
-            cycle_path = list(recursion_stack) + [node_id]
-            cycle_str = " → ".join(cycle_path)
-            error = NodeNetworkValidationError(
-                f"Circular reference detected: {cycle_str}",
-                details={"cycle_path": cycle_path},
-            )
-            raise error
-
-        # If already visited, skip (but don't add to recursion stack)
-        if node_id in visited:
-            return
-
-        # Add to visited and recursion stack
-        visited.add(node_id)
-        recursion_stack.add(node_id)
-
-        # Add node to network
-        nodes[node_id] = node
-
-        # Resolve and load referenced nodes
-        for ref in node.references:
-            try:
-                # Validate reference exists (use network_root for relative paths, with version if provided)
-                if isinstance(self.resolver, FilesystemReferenceResolver):
-                    if not self.resolver.validate(ref.path, network_root, version):
-                        raise NodeReferenceNotFoundError(
-                            f"Reference not found: {ref.path} (from {node_id})",
-                            reference_path=ref.path,
-                        )
-                else:
-                    if not self.resolver.validate(ref.path, network_root):
-                        raise NodeReferenceNotFoundError(
-                            f"Reference not found: {ref.path} (from {node_id})",
-                            reference_path=ref.path,
-                        )
-
-                # Resolve reference (use network_root for relative paths, with version if provided)
-                if isinstance(self.resolver, FilesystemReferenceResolver):
-                    referenced_node = self.resolver.resolve(ref.path, network_root, version)
-                else:
-                    referenced_node = self.resolver.resolve(ref.path, network_root)
-
-                # Persist resolved path for downstream consumers (inliners, exporters, etc.)
-                try:
-                    ref.resolved_path = str(referenced_node.id)
-                except Exception:
-                    pass
-
-                # Recursively build network for referenced node
-                # Always use network_root for relative path resolution
-                self._build_network_recursive(
-                    referenced_node,
-                    base_path,  # Keep for compatibility, but not used for resolution
-                    network_root,  # Use network root for all relative path resolution
-                    nodes,
-                    visited,
-                    recursion_stack,
-                    config,
-                    version,  # Pass version through recursion
-                    depth + 1,
+        root_id = str(root_node.id)
+        node_index: dict[str, int] = {root_id: 0}
+        colors = bytearray([_ON_PATH])
+        path: list[str] = [root_id]
+        nodes[root_id] = root_node
+        total_size = self._check_node_limits(root_node, len(nodes), config)
+        stack: list[tuple[ContextNode, Iterator[NodeReference], int, set[str]]] = [
+            (root_node, iter(root_node.references), 0, _child_ids(root_node))
+        ]
+        max_visited_depth = 0
+        # Nodes already resolved in this build, by reference path (network_root and
+        # version are fixed for the whole build, so the path alone is a valid key)
+        resolved_refs: dict[str, ContextNode] = {}
+
+        while stack:
+            node, references, depth, linked_ids = stack[-1]
+            node_id = path[-1]
+
+            ref = next(references, None)
+            if ref is None:
+                # All references handled - backtrack
+                stack.pop()
+                path.pop()
+                colors[node_index[node_id]] = _DONE
+                continue
+
+            referenced_node = resolved_refs.get(ref.path)
+            if referenced_node is None:
+                referenced_node = self._resolve_reference(ref, node_id, network_root, version)
+            else:
+                ref.resolved_path = str(referenced_node.id)
+            child_id = str(referenced_node.id)
+            child_depth = depth + 1
+
+            # Check depth limit
+            if child_depth > config.max_depth:
+                raise NodeNetworkDepthExceededError(
+                    f"Network depth {child_depth} exceeds maximum depth {config.max_depth}"
                 )
 
-                # Add referenced node as child
-                if referenced_node.id not in [child.id for child in node.children]:
-                    node.children.append(referenced_node)
+            child_index = node_index.get(child_id)
+            if child_index is None:
+                # First visit: intern, mark on path and descend after linking as child
+                node_index[child_id] = len(colors)
+                colors.append(_ON_PATH)
+                path.append(child_id)
+                nodes[child_id] = referenced_node
+                total_size += self._check_node_limits(referenced_node, len(nodes), config)
+                stack.append(
+                    (
+                        referenced_node,
+                        iter(referenced_node.references),
+                        child_depth,
+                        _child_ids(referenced_node),
+                    )
+                )
+                if child_depth > max_visited_depth:
+                    max_visited_depth = child_depth
+            elif colors[child_index] == _ON_PATH:
+                # Build cycle path for error message
+                cycle_path = path[path.index(child_id) :] + [child_id]
+                cycle_str = " → ".join(cycle_path)
+                raise NodeNetworkValidationError(
+                    f"Circular reference detected: {cycle_str}",
+                    details={"cycle_path": cycle_path},
+                )
+            else:
+                # Already built: link the network's instance instead of the fresh load
+                referenced_node = nodes[child_id]
+            resolved_refs[ref.path] = referenced_node
 
-            except (NodeReferenceNotFoundError, PathResolutionError):
-                raise
-            except Exception as e:
-                raise NodeReferenceNotFoundError(
-                    f"Failed to resolve reference {ref.path} from {node_id}: {e}",
-                    reference_path=ref.path,
-                ) from e
+            # Add referenced node as child
+            if child_id not in linked_ids:
+                linked_ids.add(child_id)
+                node.children.append(referenced_node)
 
-        # Remove from recursion stack (backtrack)
-        recursion_stack.remove(node_id)
+        return max_visited_depth + 1, total_size
 
-    def _calculate_depth(self, root: ContextNode, nodes: dict[str, ContextNode]) -> int:
-        """Calculate maximum depth of network.
+    def _resolve_reference(
+        self,
+        ref: NodeReference,
+        node_id: str,
+        network_root: Path,
+        version: Optional[VersionSpec],
+    ) -> ContextNode:
+        """Validate and resolve a single reference of a node.
 
         Args:
-            root: Root node
-            nodes: All nodes in network
+            ref: Reference to resolve
+            node_id: ID of the node holding the reference (for error messages)
+            network_root: Root directory of the network for resolving relative references
+            version: Optional version specification for reference resolution
 
         Returns:
-            Maximum depth of network
-        """
-        visited: set[str] = set()
-
-        def dfs(node: ContextNode, current_depth: int) -> int:
-            node_id = str(node.id)
-            if node_id in visited:
-                return current_depth - 1
-            visited.add(node_id)
-
-            max_depth = current_depth
-            for child in node.children:
-                child_depth = dfs(child, current_depth + 1)
-                max_depth = max(max_depth, child_depth)
+            Referenced node loaded by the resolver
 
-            return max_depth
-
-        return dfs(root, 1)
+        Raises:
+            NodeReferenceNotFoundError: If reference cannot be validated or resolved
+            PathResolutionError: If the resolver rejects the reference path
+        """
+        try:
+            # Validate and resolve reference (use network_root for relative paths,
+            # with version if provided)
+            if _supports_try_resolve(self.resolver):
+                # Single path resolution for both validation and loading
+                resolved_node = self.resolver.try_resolve(ref.path, network_root, version)
+                if resolved_node is None:
+                    raise NodeReferenceNotFoundError(
+                        f"Reference not found: {ref.path} (from {node_id})",
+                        reference_path=ref.path,
+                    )
+                referenced_node = resolved_node
+            elif isinstance(self.resolver, FilesystemReferenceResolver):
+                if not self.resolver.validate(ref.path, network_root, version):
+                    raise NodeReferenceNotFoundError(
+                        f"Reference not found: {ref.path} (from {node_id})",
+                        reference_path=ref.path,
+                    )
+                referenced_node = self.resolver.resolve(ref.path, network_root, version)
+            else:
+                if not self.resolver.validate(ref.path, network_root):
+                    raise NodeReferenceNotFoundError(
+                        f"Reference not found: {ref.path} (from {node_id})",
+                        reference_path=ref.path,
+                    )
+                referenced_node = self.resolver.resolve(ref.path, network_root)
+
+            # Persist resolved path for downstream consumers (inliners, exporters, etc.)
+            try:
+                ref.resolved_path = str(referenced_node.id)
+            except Exception:
+                pass
+
+            return referenced_node
+
+        except (NodeReferenceNotFoundError, PathResolutionError):
+            raise
+        except Exception as e:
+            raise NodeReferenceNotFoundError(
+                f"Failed to resolve reference {ref.path} from {node_id}: {e}",
+                reference_path=ref.path,
+            ) from e
 
     def collect_referenced_files(
         self,
@@ -13,11 +13,14 @@ reference types to be added without modifying existing code (OCP).
 
 from __future__ import annotations
 
-import json
+import re
+from functools import lru_cache
+from pathlib import Path
 from typing import TYPE_CHECKING, Any, Optional
 
 import yaml
 
+from promptic.rendering.serialization import dump_json
 from promptic.rendering.strategies import (
     Jinja2RefStrategy,
     MarkdownLinkStrategy,
@@ -28,6 +31,36 @@ from promptic.rendering.strategies import (
 if TYPE_CHECKING:
     from promptic.context.nodes.models import ContextNode, NodeNetwork
 
+_VERSION_SUFFIX_PATTERN = re.compile(r"_v(\d+(?:\.\d+)*(?:\.\d+)?)")
+
+# Literal fragments every text reference of the built-in strategies contains:
+# "{#" opens a Jinja2 ref comment and "](" joins a markdown link's text and path.
+_DEFAULT_TEXT_SENTINELS = ("{#", "](")
+# Exact strategy types the sentinels are valid for (subclasses may match anything)
+_SENTINEL_STRATEGY_TYPES = frozenset(
+    {Jinja2RefStrategy, MarkdownLinkStrategy, StructuredRefStrategy}
+)
+
+
+@lru_cache(maxsize=4096)
+def _split_node_path(node_id: str) -> tuple[str, str, str]:
+    """Split a node ID into (base name without version suffix, extension, parent dir).
+
+    # AICODE-NOTE: _find_node compares every node in the network on every fallback
+    # lookup. The per-node parts depend only on the node ID, so they are parsed (Path
+    # split + version regex) once per ID and cached instead of once per comparison.
+    """
+    node_path = Path(node_id)
+    node_name = node_path.name
+    node_base = node_name.rsplit(".", 1)[0] if "." in node_name else node_name
+
+    # Remove version suffix from node base name for comparison
+    version_match = _VERSION_SUFFIX_PATTERN.search(node_base)
+    if version_match:
+        node_base = node_base.replace(version_match.group(0), "")
+
+    return node_base, node_path.suffix, str(node_path.parent)
+
 
 class ReferenceInliner:
     """Service for inlining referenced content into nodes.
@@ -84,23 +117,61 @@ class ReferenceInliner:
             - str for text formats (markdown, jinja2 with raw_content)
             - dict for structured formats (yaml, json without raw_content)
         """
+        return self._inline_references(node, network, target_format, {})
+
+    def _inline_references(
+        self,
+        node: ContextNode,
+        network: NodeNetwork,
+        target_format: str,
+        rendered_children: dict[tuple[str, str, str], str],
+    ) -> str | dict[str, Any]:
+        """Inline references of a node, sharing rendered children across the whole call.
+
+        Args:
+            node: Node to process
+            network: Network containing all nodes for lookup
+            target_format: Target output format
+            rendered_children: Memo of rendered children for the top-level call
+        """
         content = node.content.copy()
 
         # Create lookup function that finds nodes by path
+        # AICODE-NOTE: Resolver metadata is indexed on first lookup and lookups are
+        # memoized per path, so repeated references (and every strategy pass over
+        # the same content) skip both the reference scan and the _find_node fallback.
+        resolved_by_path: Optional[dict[str, ContextNode]] = None
+        lookup_cache: dict[str, Optional[ContextNode]] = {}
+
         def node_lookup(path: str) -> Optional[ContextNode]:
-            resolved = self._lookup_resolved_reference(node, path, network)
-            if resolved is not None:
-                return resolved
-            return self._find_node(path, network)
+            nonlocal resolved_by_path
+            if path in lookup_cache:
+                return lookup_cache[path]
+            if resolved_by_path is None:
+                resolved_by_path = self._resolved_reference_map(node, network)
+            resolved = resolved_by_path.get(path)
+            if resolved is None:
+                resolved = self._find_node(path, network)
+            lookup_cache[path] = resolved
+            return resolved
 
         # Create content renderer that recursively processes child nodes
         def content_renderer(child_node: ContextNode, fmt: str) -> Any:
-            return self._render_child(child_node, network, fmt, target_format)
+            return self._render_child(child_node, network, fmt, target_format, rendered_children)
 
         # Process based on content type
         if "raw_content" in content and isinstance(content["raw_content"], str):
             # Text content (markdown, jinja2)
             processed = content["raw_content"]
+            # AICODE-NOTE: Most nodes are leaves without references. A plain substring
+            # scan rejects them before any strategy runs its regex over the content.
+            # The sentinels only cover the built-in strategies, and self.strategies is
+            # public and mutable, so the check is made per call: any custom strategy
+            # always runs its own can_process.
+            if not any(s in processed for s in _DEFAULT_TEXT_SENTINELS) and all(
+                type(strategy) in _SENTINEL_STRATEGY_TYPES for strategy in self.strategies
+            ):
+                return processed
             for strategy in self.strategies:
                 if strategy.can_process(processed):
                     processed = strategy.process_string(
@@ -125,68 +196,62 @@ class ReferenceInliner:
         # strategy tries exact match, partial match, and suffix match
         # to handle various path formats (relative, absolute, with/without extension).
         # Also handles versioned files by matching base names (without version suffix).
+        #
+        # Exact matches are a dict probe on network.nodes before the linear scan, so
+        # lookups by full node ID are O(1) and are not shadowed by an earlier node whose
+        # ID merely contains the path (e.g. "a.md" inside "/docs/data.md").
         """
-        import re
-        from pathlib import Path
+        exact = network.nodes.get(path)
+        if exact is not None:
+            return exact
 
         # Normalize the search path
         search_path = Path(path)
         search_name = search_path.name
         search_base = search_name.rsplit(".", 1)[0] if "." in search_name else search_name
         search_ext = search_path.suffix
+        search_parent = str(search_path.parent)
 
         for node_id, node in network.nodes.items():
-            node_path = Path(node_id)
+            node_id_str = str(node_id)
 
             # Exact match
-            if path == str(node_id) or path in str(node_id) or str(node_id).endswith(path):
+            if path == node_id_str or path in node_id_str or node_id_str.endswith(path):
                 return node
 
             # Match by base name (handles versioned files)
             # Check if the node path ends with the same directory structure and base name
-            node_name = node_path.name
-            node_base = node_name.rsplit(".", 1)[0] if "." in node_name else node_name
-            node_ext = node_path.suffix
-
-            # Remove version suffix from node base name for comparison
-            version_match = re.search(r"_v(\d+(?:\.\d+)*(?:\.\d+)?)", node_base)
-            if version_match:
-                node_base_no_version = node_base.replace(version_match.group(0), "")
-            else:
-                node_base_no_version = node_base
+            node_base_no_version, node_ext, node_parent = _split_node_path(node_id_str)
 
             # Check if base names and extensions match, and directory structure matches
             if (
                 node_base_no_version == search_base
                 and node_ext == search_ext
-                and (
-                    str(node_path.parent).endswith(str(search_path.parent))
-                    or str(search_path.parent) in str(node_path.parent)
-                )
+                and (node_parent.endswith(search_parent) or search_parent in node_parent)
             ):
                 return node
 
         return None
 
-    def _lookup_resolved_reference(
-        self, owner: ContextNode, path: str, network: NodeNetwork
-    ) -> Optional[ContextNode]:
-        """Return node using the resolver metadata captured during network build."""
-        resolved_candidates: list[str] = []
+    def _resolved_reference_map(
+        self, owner: ContextNode, network: NodeNetwork
+    ) -> dict[str, ContextNode]:
+        """Map reference paths of a node to nodes using resolver metadata from network build.
+
+        The first reference with a given path whose resolved_path is in the network wins.
+        """
+        resolved_by_path: dict[str, ContextNode] = {}
 
         for reference in owner.references:
-            if reference.path != path:
+            if reference.path in resolved_by_path:
                 continue
             resolved_path = getattr(reference, "resolved_path", None)
             if resolved_path:
-                resolved_candidates.append(resolved_path)
-
-        for candidate in resolved_candidates:
-            node = network.nodes.get(candidate)
-            if node is not None:
-                return node
+                node = network.nodes.get(resolved_path)
+                if node is not None:
+                    resolved_by_path[reference.path] = node
 
-        return None
+        return resolved_by_path
 
     def _render_child(
         self,
@@ -194,6 +259,48 @@ class ReferenceInliner:
         network: NodeNetwork,
         child_format: str,
         parent_format: str,
+        rendered_children: Optional[dict[tuple[str, str, str], str]] = None,
+    ) -> Any:
+        """Render a child node for inline insertion, reusing earlier renders of it.
+
+        # AICODE-NOTE: A node shared by several parents (a DAG, not a tree) used to be
+        # re-rendered - with its whole subtree - once per reference. Renders are now
+        # memoized per top-level inline_references() call by (node ID, child format,
+        # parent format). Only string results are memoized: a dict inserted at several
+        # places would be one shared object, which yaml.dump emits as anchors/aliases.
+
+        Args:
+            child: Child node to render
+            network: Network for recursive lookups
+            child_format: Format requested for the child content
+            parent_format: Target format of the parent (for wrapping decisions)
+            rendered_children: Memo of rendered children for the current top-level call
+
+        Returns:
+            Rendered content (string or dict depending on formats)
+        """
+        if rendered_children is None:
+            rendered_children = {}
+
+        key = (str(child.id), child_format, parent_format)
+        rendered = rendered_children.get(key)
+        if rendered is not None:
+            return rendered
+
+        result = self._render_child_content(
+            child, network, child_format, parent_format, rendered_children
+        )
+        if isinstance(result, str):
+            rendered_children[key] = result
+        return result
+
+    def _render_child_content(
+        self,
+        child: ContextNode,
+        network: NodeNetwork,
+        child_format: str,
+        parent_format: str,
+        rendered_children: dict[tuple[str, str, str], str],
     ) -> Any:
         """Render a child node for inline insertion.
 
@@ -207,12 +314,13 @@ class ReferenceInliner:
             network: Network for recursive lookups
             child_format: Format requested for the child content
             parent_format: Target format of the parent (for wrapping decisions)
+            rendered_children: Memo of rendered children for the current top-level call
 
         Returns:
             Rendered content (string or dict depending on formats)
         """
         # Recursively process the child node
-        child_content = self.inline_references(child, network, child_format)
+        child_content = self._inline_references(child, network, child_format, rendered_children)
 
         # Handle wrapping for cross-format embedding
         if parent_format == "markdown":
@@ -224,7 +332,7 @@ class ReferenceInliner:
                     ).strip()
                     return f"```yaml\n{native_str}\n```"
                 else:
-                    native_str = json.dumps(child_content, indent=2)
+                    native_str = dump_json(child_content)
                     return f"```json\n{native_str}\n```"
 
         # For non-markdown parent formats or when child is text, return as-is
@@ -235,6 +343,6 @@ class ReferenceInliner:
         if child_format in ("yaml",) and isinstance(child_content, dict):
             return yaml.dump(child_content, default_flow_style=False, sort_keys=False).strip()
         elif child_format in ("json",) and isinstance(child_content, dict):
-            return json.dumps(child_content, indent=2)
+            return dump_json(child_content)
 
         return child_content
@@ -20,7 +20,7 @@ from promptic.context.nodes.models import ContextNode, NodeNetwork
 T = TypeVar("T")
 
 
-@dataclass
+@dataclass(slots=True)
 class RenderContext:
     """
     Context object passed through the rendering pipeline.
@@ -47,13 +47,19 @@ class RenderContext:
     metadata: dict[str, Any] = field(default_factory=dict)
 
     def with_content(self, new_content: Any) -> "RenderContext":
-        """Create new context with updated content."""
+        """Create new context with updated content.
+
+        # AICODE-NOTE: Every stage calls this once per render. Node, network and format
+        # are shared references; only metadata gets its own dict so a stage can update
+        # it without affecting earlier contexts (empty metadata skips the copy call).
+        """
+        metadata = self.metadata
         return RenderContext(
-            node=self.node,
-            network=self.network,
-            target_format=self.target_format,
-            content=new_content,
-            metadata=self.metadata.copy(),
+            self.node,
+            self.network,
+            self.target_format,
+            new_content,
+            metadata.copy() if metadata else {},
         )
 
 
@@ -153,15 +159,15 @@ class FormatConverterStage(PipelineStage):
 
         # Convert structured content to string for markdown output
         if target_format == "markdown" and isinstance(content, dict):
-            import json
-
             import yaml
 
+            from promptic.rendering.serialization import dump_json
+
             if source_format == "yaml":
                 formatted = yaml.dump(content, default_flow_style=False, sort_keys=False)
                 new_content = f"```yaml\n{formatted}```"
             elif source_format == "json":
-                formatted = json.dumps(content, indent=2)
+                formatted = dump_json(content)
                 new_content = f"```json\n{formatted}\n```"
             else:
                 new_content = str(content)
@@ -0,0 +1,69 @@
+"""JSON serialization of rendered structured content.
+
+# AICODE-NOTE: Rendering emits structured content as indented JSON. The stdlib encoder
+# drops to its pure-Python implementation whenever indent is set, so dump_json uses
+# orjson (already a core dependency) and reproduces json.dumps(content, indent=2):
+# non-ASCII characters are escaped as \\uXXXX afterwards (ensure_ascii), and content
+# orjson cannot encode (e.g. integers beyond 64 bits) goes through the stdlib encoder.
+# orjson also writes NaN / Infinity as null and formats floats below 1e-4 differently
+# (1e-7 instead of 1e-07), so content holding such floats goes through the stdlib
+# encoder too. The content is only walked when the output shows a hint of them.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import re
+from typing import Any
+
+import orjson
+
+_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+# orjson escapes control characters itself; everything outside printable ASCII is left
+# for this pattern, matching what json.dumps escapes with ensure_ascii=True.
+_NON_ASCII_PATTERN = re.compile(r"[^\x00-\x7e]")
+
+# Every float orjson renders unlike json.dumps leaves one of these in its output.
+_FLOAT_MISMATCH_HINT = re.compile(r"null|e-|0\.0000")
+
+
+def _has_mismatched_float(value: Any) -> bool:
+    if isinstance(value, float):
+        return not math.isfinite(value) or 0.0 < abs(value) < 1e-4
+    if isinstance(value, dict):
+        return any(
+            _has_mismatched_float(key) or _has_mismatched_float(item) for key, item in value.items()
+        )
+    if isinstance(value, (list, tuple)):
+        return any(_has_mismatched_float(item) for item in value)
+    return False
+
+
+def _escape_non_ascii(match: re.Match[str]) -> str:
+    code = ord(match.group(0))
+    if code < 0x10000:
+        return f"\\u{code:04x}"
+    code -= 0x10000
+    return f"\\u{0xD800 | (code >> 10):04x}\\u{0xDC00 | (code & 0x3FF):04x}"
+
+
+def dump_json(content: Any) -> str:
+    """Serialize content as JSON indented by two spaces, like json.dumps(content, indent=2).
+
+    Args:
+        content: JSON-compatible content (dicts, lists, scalars)
+
+    Returns:
+        ASCII-only JSON text
+    """
+    try:
+        rendered = orjson.dumps(content, option=_JSON_OPTIONS).decode()
+    except orjson.JSONEncodeError:
+        return json.dumps(content, indent=2)
+    if _FLOAT_MISMATCH_HINT.search(rendered) and _has_mismatched_float(content):
+        return json.dumps(content, indent=2)
+    if rendered.isascii():
+        return rendered
+    return _NON_ASCII_PATTERN.sub(_escape_non_ascii, rendered)
@@ -31,7 +31,8 @@ class Jinja2RefStrategy(ReferenceStrategy):
 
     def can_process(self, content: Any) -> bool:
         """Check if content contains Jinja2 ref comments."""
-        if isinstance(content, str):
+        # Skip the regex for text without a Jinja2 comment opener
+        if isinstance(content, str) and "{#" in content:
             return bool(self.REF_PATTERN.search(content))
         return False
 
@@ -16,13 +16,17 @@ from promptic.rendering.strategies.base import ReferenceStrategy
 class MarkdownLinkStrategy(ReferenceStrategy):
     """Strategy for processing markdown link references [text](path).
 
-    Pattern: \\[([^\\]]+)\\]\\(([^)]+)\\)
+    Pattern: \\[([^\\]]+)\\]\\((?!https?://|mailto:|#)([^)]+)\\)
     Example: [Instructions](instructions.md) -> content of instructions.md
 
     External links starting with http://, https://, mailto:, or # are preserved.
+
+    # AICODE-NOTE: External links are excluded by a negative lookahead in LINK_PATTERN,
+    # so the regex engine never reports them and re.sub runs the Python callback only
+    # for links that may resolve to a node. EXTERNAL_PREFIXES lists the same prefixes.
     """
 
-    LINK_PATTERN = re.compile(r"\[([^\]]+)\]\(([^)]+)\)")
+    LINK_PATTERN = re.compile(r"\[([^\]]+)\]\((?!https?://|mailto:|#)([^)]+)\)")
     EXTERNAL_PREFIXES = ("http://", "https://", "mailto:", "#")
 
     @property
@@ -30,8 +34,9 @@ class MarkdownLinkStrategy(ReferenceStrategy):
         return "markdown_link"
 
     def can_process(self, content: Any) -> bool:
-        """Check if content contains markdown links."""
-        if isinstance(content, str):
+        """Check if content contains markdown links to local paths."""
+        # No "](" means no link syntax at all
+        if isinstance(content, str) and "](" in content:
             return bool(self.LINK_PATTERN.search(content))
         return False
 
@@ -45,13 +50,7 @@ class MarkdownLinkStrategy(ReferenceStrategy):
         """Process string content and replace markdown links with referenced content."""
 
         def replace_link(match: re.Match[str]) -> str:
-            path = match.group(2)
-
-            # Preserve external links
-            if path.startswith(self.EXTERNAL_PREFIXES):
-                return match.group(0)
-
-            node = node_lookup(path)
+            node = node_lookup(match.group(2))
             if node:
                 return content_renderer(node, target_format)
             return match.group(0)
@@ -33,22 +33,26 @@ class StructuredRefStrategy(ReferenceStrategy):
         return False
 
     def _has_ref(self, data: dict[str, Any]) -> bool:
-        """Recursively check if dict contains $ref."""
-        for value in data.values():
-            if isinstance(value, dict):
-                if "$ref" in value:
-                    return True
-                if self._has_ref(value):
-                    return True
-            elif isinstance(value, list):
-                for item in value:
-                    if isinstance(item, dict):
-                        # Check if the list item itself is a $ref
-                        if "$ref" in item:
-                            return True
-                        # Or if it contains nested $refs
-                        if self._has_ref(item):
-                            return True
+        """Check if dict contains $ref in any nested dict value or list item.
+
+        # AICODE-NOTE: Walks nested dicts with an explicit stack instead of recursion:
+        # no call frame per nesting level and no recursion limit on deep content.
+        # Only dicts directly inside dict values or lists are inspected, as before.
+        """
+        pending = [data]
+        while pending:
+            for value in pending.pop().values():
+                if isinstance(value, dict):
+                    if "$ref" in value:
+                        return True
+                    pending.append(value)
+                elif isinstance(value, list):
+                    for item in value:
+                        # Check if the list item itself is a $ref, or queue it for nested $refs
+                        if isinstance(item, dict):
+                            if "$ref" in item:
+                                return True
+                            pending.append(item)
         return False
 
     def process_string(
@@ -78,43 +82,58 @@ class StructuredRefStrategy(ReferenceStrategy):
         content_renderer: Callable[[Any, str], Any],
         target_format: str,
     ) -> dict[str, Any]:
-        """Recursively replace $ref objects with resolved content."""
-        result = {}
+        """Recursively replace $ref objects with resolved content.
+
+        # AICODE-NOTE: Copy-on-write: dicts and lists without a resolved $ref below them
+        # are returned as-is, and only containers on the path to a replacement are
+        # rebuilt. The input is never mutated. Unchanged subtrees are shared with the
+        # input, just like content without any $ref passed through unprocessed.
+        """
+        changes: dict[str, Any] = {}
         for key, value in data.items():
             if isinstance(value, dict):
-                if "$ref" in value and isinstance(value["$ref"], str):
-                    ref_path = value["$ref"]
-                    node = node_lookup(ref_path)
-                    if node:
-                        result[key] = content_renderer(node, target_format)
-                    else:
-                        result[key] = value
-                else:
-                    result[key] = self._replace_refs(
-                        value, node_lookup, content_renderer, target_format
-                    )
+                new_value = self._replace_dict(value, node_lookup, content_renderer, target_format)
             elif isinstance(value, list):
-                new_list = []
-                for item in value:
-                    if isinstance(item, dict):
-                        # Check if list item is a $ref
-                        if "$ref" in item and isinstance(item["$ref"], str):
-                            ref_path = item["$ref"]
-                            node = node_lookup(ref_path)
-                            if node:
-                                new_list.append(content_renderer(node, target_format))
-                            else:
-                                new_list.append(item)
-                        else:
-                            # Recursively process nested dict
-                            new_list.append(
-                                self._replace_refs(
-                                    item, node_lookup, content_renderer, target_format
-                                )
-                            )
-                    else:
-                        new_list.append(item)
-                result[key] = new_list
+                new_value = self._replace_list(value, node_lookup, content_renderer, target_format)
             else:
-                result[key] = value
-        return result
+                continue
+            if new_value is not value:
+                changes[key] = new_value
+        if not changes:
+            return data
+        return {**data, **changes}
+
+    def _replace_dict(
+        self,
+        value: dict[str, Any],
+        node_lookup: Callable[[str], Optional[Any]],
+        content_renderer: Callable[[Any, str], Any],
+        target_format: str,
+    ) -> Any:
+        """Resolve a $ref object, or replace refs nested inside a plain dict."""
+        if "$ref" in value and isinstance(value["$ref"], str):
+            node = node_lookup(value["$ref"])
+            if node:
+                return content_renderer(node, target_format)
+            return value
+        return self._replace_refs(value, node_lookup, content_renderer, target_format)
+
+    def _replace_list(
+        self,
+        items: list[Any],
+        node_lookup: Callable[[str], Optional[Any]],
+        content_renderer: Callable[[Any, str], Any],
+        target_format: str,
+    ) -> list[Any]:
+        """Replace $ref objects among list items (dict items only, as in dict values)."""
+        new_items = [
+            (
+                self._replace_dict(item, node_lookup, content_renderer, target_format)
+                if isinstance(item, dict)
+                else item
+            )
+            for item in items
+        ]
+        if all(new is old for new, old in zip(new_items, items)):
+            return items
+        return new_items
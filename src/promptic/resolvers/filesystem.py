@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 from typing import Optional
 
@@ -9,7 +10,6 @@ from promptic.context.nodes.errors import NodeReferenceNotFoundError, PathResolu
 from promptic.context.nodes.models import ContextNode
 from promptic.resolvers.base import NodeReferenceResolver
 from promptic.versioning import VersionSpec
-from promptic.versioning.adapters.scanner import VersionedFileScanner
 from promptic.versioning.domain.errors import VersionNotFoundError
 from promptic.versioning.utils.path_resolver import PromptPathResolver
 
@@ -78,13 +78,7 @@ class FilesystemReferenceResolver(NodeReferenceResolver):
         except (FileNotFoundError, VersionNotFoundError) as exc:
             raise NodeReferenceNotFoundError(f"Reference not found: {path} ({exc})") from exc
 
-        # Load node using SDK function (lazy import to avoid circular dependency)
-        try:
-            from promptic.sdk.nodes import load_node
-
-            return load_node(resolved_path)
-        except Exception as e:
-            raise PathResolutionError(f"Failed to load node from {resolved_path}: {e}") from e
+        return self._load_node(resolved_path)
 
     def validate(self, path: str, base_path: Path, version: Optional[VersionSpec] = None) -> bool:
         """Validate that a reference path is valid.
@@ -97,17 +91,61 @@ class FilesystemReferenceResolver(NodeReferenceResolver):
         Returns:
             True if path is valid, False otherwise
         """
+        return self._validated_path(path, base_path, version) is not None
+
+    def try_resolve(
+        self, path: str, base_path: Path, version: Optional[VersionSpec] = None
+    ) -> Optional[ContextNode]:
+        """Validate and resolve a reference path with a single path resolution.
+
+        # AICODE-NOTE: validate() followed by resolve() resolves the same path twice
+        (version scan, directory scan, filesystem stats). Network building needs both
+        answers for every reference, so this method resolves once and loads the node
+        only when the path is valid.
+
+        Args:
+            path: Reference path (file path)
+            base_path: Base path for relative resolution
+            version: Optional version specification (overrides constructor version if provided)
+
+        Returns:
+            Resolved ContextNode instance, or None if validate() would return False
+
+        Raises:
+            PathResolutionError: If the resolved file cannot be loaded
+        """
+        resolved_path = self._validated_path(path, base_path, version)
+        if resolved_path is None:
+            return None
+        return self._load_node(resolved_path)
+
+    def _validated_path(
+        self, path: str, base_path: Path, version: Optional[VersionSpec]
+    ) -> Optional[Path]:
+        """Return the existing resolved path; None on a miss, which try_resolve() returns as-is."""
         try:
             version_to_use = self._determine_version_spec(path, version)
             resolved_path = self._resolve_path(path, base_path, version_to_use)
-            return resolved_path.exists()
         except (FileNotFoundError, VersionNotFoundError, PathResolutionError):
-            return False
+            return None
+        # AICODE-NOTE: os.path.exists/isfile stat the path directly; pathlib's methods
+        # add method dispatch and error filtering around the same stat call.
+        return resolved_path if os.path.exists(resolved_path) else None
+
+    def _load_node(self, resolved_path: Path) -> ContextNode:
+        """Load the node at a validated path; raises PathResolutionError if loading fails."""
+        # Load node using SDK function (lazy import to avoid circular dependency)
+        try:
+            from promptic.sdk.nodes import load_node
+
+            return load_node(resolved_path)
+        except Exception as e:
+            raise PathResolutionError(f"Failed to load node from {resolved_path}: {e}") from e
 
     def _resolve_path(
         self, path: str, base_path: Path, version: Optional[VersionSpec] = None
     ) -> Path:
-        base_dir = base_path.parent if base_path.is_file() else base_path
+        base_dir = base_path.parent if os.path.isfile(base_path) else base_path
 
         try:
             version_to_use = self._determine_version_spec(path, version)
@@ -138,7 +176,9 @@ class FilesystemReferenceResolver(NodeReferenceResolver):
         if version_to_use is None:
             return None
 
-        scanner = VersionedFileScanner(config=self._path_resolver._config)
+        # AICODE-NOTE: Reuse the path resolver's scanner (same config) instead of building
+        # a scanner - and compiling its version pattern - on every validate/resolve call.
+        scanner = self._path_resolver.scanner
         basename = Path(ref_path).name
         has_version = scanner.extract_version_from_filename(basename) is not None
 
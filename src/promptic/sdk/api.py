@@ -20,6 +20,7 @@ from typing import TYPE_CHECKING, Any, Literal, Optional
 
 from promptic.context.nodes.models import NetworkConfig
 from promptic.sdk.nodes import load_node_network, render_node_network
+from promptic.utils.text_io import read_utf8_text
 from promptic.versioning import (
     ExportResult,
     HierarchicalVersionResolver,
@@ -278,7 +279,7 @@ def load_prompt(
         scanner = VersionedFileScanner(config=versioning_config)
         resolved_path = scanner.resolve_version(str(path_obj), version, classifier=classifier)
 
-    return Path(resolved_path).read_text(encoding="utf-8")
+    return read_utf8_text(resolved_path)
 
 
 def export_version(
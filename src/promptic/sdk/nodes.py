@@ -2,22 +2,43 @@
 
 from __future__ import annotations
 
+import copy
+import re
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Callable, Literal, Optional
 
 from promptic.context.nodes.errors import FormatDetectionError, FormatParseError
-from promptic.context.nodes.models import ContextNode, NetworkConfig, NodeNetwork
-from promptic.context.variables import SubstitutionContext, VariableSubstitutor
+from promptic.context.nodes.models import ContextNode, NetworkConfig, NodeNetwork, NodeReference
+from promptic.context.variables import VariableSubstitutor
 from promptic.format_parsers.registry import get_default_registry
 from promptic.pipeline.network.builder import NodeNetworkBuilder
 from promptic.rendering import ReferenceInliner
+from promptic.rendering.serialization import dump_json
 from promptic.resolvers.filesystem import FilesystemReferenceResolver
+from promptic.utils.text_io import read_utf8_text
 from promptic.versioning import VersionSpec
 from promptic.versioning.utils.path_resolver import PromptPathResolver
 
 if TYPE_CHECKING:
     from promptic.versioning.config import VersioningConfig
 
+# Format inferred from the file extension when content-based detection fails
+_EXTENSION_FORMATS = {
+    ".yaml": "yaml",
+    ".yml": "yaml",
+    ".md": "markdown",
+    ".markdown": "markdown",
+    ".jinja": "jinja2",
+    ".jinja2": "jinja2",
+    ".json": "json",
+}
+
+_UNSAFE_SEGMENT_CHARS = re.compile(r"[^a-zA-Z0-9_]")
+_REPEATED_UNDERSCORES = re.compile(r"_+")
+# Version suffix of a file stem: _v{digits} optionally followed by .{digits} and .{digits}
+_VERSION_SUFFIX = re.compile(r"_v\d+(\.\d+)?(\.\d+)?$")
+
 
 def load_node(path: Path | str) -> ContextNode:
     """Load a single node from file path using format detection and parser registry.
@@ -29,7 +50,7 @@ def load_node(path: Path | str) -> ContextNode:
     Side Effects:
         - Reads file from filesystem
         - Uses format parser registry (may trigger parser initialization)
-        - No state mutation (pure function except for I/O)
+        - Caches parse results per file path and stat identity
 
     Args:
         path: File path to load node from (relative or absolute)
@@ -51,46 +72,75 @@ def load_node(path: Path | str) -> ContextNode:
         2
     """
     path_obj = Path(path)
-    if not path_obj.exists():
-        raise FileNotFoundError(f"Node file not found: {path_obj}")
 
-    # Read file content
-    content = path_obj.read_text(encoding="utf-8")
+    # AICODE-NOTE: Parsing (YAML especially) dominates load time, and the same files
+    # are loaded again by every network build. Parse results are cached by path plus
+    # the file's stat identity, so an edited or replaced file is parsed again, and by
+    # the parser registry generation, so newly registered parsers apply at once. Each
+    # call gets its own content and references: network building sets resolved_path
+    # on references and appends children, which must not leak into the cache.
+    try:
+        stat = path_obj.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Node file not found: {path_obj}") from None
+
+    format_name, json_content, references = _parse_node_file(
+        str(path_obj),
+        stat.st_mtime_ns,
+        stat.st_size,
+        stat.st_ino,
+        get_default_registry().generation,
+    )
+
+    # Create ContextNode
+    node = ContextNode(
+        id=str(path_obj),
+        content=copy.deepcopy(json_content),
+        format=format_name,
+        references=[reference.model_copy() for reference in references],
+    )
+
+    return node
+
+
+@lru_cache(maxsize=1024)
+def _parse_node_file(
+    path: str, mtime_ns: int, size: int, inode: int, registry_generation: int
+) -> tuple[str, dict[str, Any], tuple[NodeReference, ...]]:
+    """Read and parse a node file; cached by path, stat identity and registry generation.
+
+    See load_node for the caching rationale.
+
+    Returns:
+        Tuple of (format name, JSON content, extracted references). The returned
+        objects are shared by all cache hits and must not be mutated.
+    """
+    path_obj = Path(path)
+
+    # Read file content (bytes decoded once; same text as read_text with universal newlines)
+    try:
+        content = read_utf8_text(path_obj)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Node file not found: {path_obj}") from None
 
     # Detect format and get parser
     registry = get_default_registry()
     try:
-        format_name = registry.detect_format(content, path_obj)
+        format_name, parser = registry.detect_parser(content, path_obj)
     except FormatDetectionError:
         # Try to infer from extension as fallback
-        ext = path_obj.suffix.lower()
-        if ext in {".yaml", ".yml"}:
-            format_name = "yaml"
-        elif ext in {".md", ".markdown"}:
-            format_name = "markdown"
-        elif ext in {".jinja", ".jinja2"}:
-            format_name = "jinja2"
-        elif ext == ".json":
-            format_name = "json"
-        else:
+        fallback_format = _EXTENSION_FORMATS.get(path_obj.suffix.lower())
+        if fallback_format is None:
             raise FormatDetectionError(f"Could not detect format for {path_obj}")
-
-    parser = registry.get_parser(format_name)
+        format_name = fallback_format
+        parser = registry.get_parser(format_name)
 
     # Parse content
     parsed = parser.parse(content, path_obj)
     json_content = parser.to_json(parsed)
     references = parser.extract_references(parsed)
 
-    # Create ContextNode
-    node = ContextNode(
-        id=str(path_obj),
-        content=json_content,
-        format=format_name,
-        references=references,
-    )
-
-    return node
+    return format_name, json_content, tuple(references)
 
 
 def render_node(
@@ -124,9 +174,7 @@ def render_node(
         >>> jinja2_output = render_node(node, "jinja2")
     """
     if target_format == "json":
-        import json
-
-        return json.dumps(node.content, indent=2)
+        return dump_json(node.content)
 
     elif target_format == "yaml":
         import yaml
@@ -294,14 +342,18 @@ def render_node_network(
         >>> network = load_node_network("prompts/note_creation.md")
         >>> output = render_node_network(network, "markdown", render_mode="full")
     """
-    import json
-
     import yaml
 
-    # Apply variables if provided (operate on deep copy to preserve original)
+    # Apply variables if provided (operate on a copy to preserve original)
+    # AICODE-NOTE: Only full mode with references renders child nodes. Otherwise just
+    # the root is rendered, so substituting (and copying) the rest of the network
+    # would be wasted work on every render.
     if vars:
-        network = network.model_copy(deep=True)
-        _apply_variables_to_network(network, vars)
+        if render_mode == "full" and network.root.references:
+            network = _copy_network_for_substitution(network)
+            _apply_variables_to_network(network, vars)
+        else:
+            network = _substitute_root_only(network, vars)
 
     # Fast path: same format, file_first mode - return raw content
     if (
@@ -327,7 +379,7 @@ def render_node_network(
                 ).strip()
                 return f"```yaml\n{yaml_str}\n```"
             elif network.root.format == "json":
-                json_str = json.dumps(inlined_content, indent=2)
+                json_str = dump_json(inlined_content)
                 return f"```json\n{json_str}\n```"
             else:
                 return str(inlined_content)
@@ -339,7 +391,7 @@ def render_node_network(
 
         elif target_format == "json":
             if isinstance(inlined_content, dict):
-                return json.dumps(inlined_content, indent=2)
+                return dump_json(inlined_content)
             return str(inlined_content)
 
         else:
@@ -366,21 +418,60 @@ def _extract_node_name(node_id: str) -> str:
     #   "templates/data.yaml" -> "data"
     #   "root.md" -> "root"
     """
-    from pathlib import Path
-
     # Get filename without path
     filename = Path(node_id).stem  # stem removes extension
 
     # Remove version suffix if present (e.g., "_v1", "_v2.0", "_v1.0.0")
-    # Pattern: _v{digits} optionally followed by .{digits} and .{digits}
-    import re
-
-    version_pattern = re.compile(r"_v\d+(\.\d+)?(\.\d+)?$")
-    base_name = version_pattern.sub("", filename)
+    base_name = _VERSION_SUFFIX.sub("", filename)
 
     return base_name
 
 
+def _copy_network_for_substitution(network: NodeNetwork) -> NodeNetwork:
+    """Copy a network so variable substitution cannot modify the original.
+
+    # AICODE-NOTE: Substitution only ever replaces node.content (structured nodes) or
+    # its "raw_content" key (text nodes), so each node needs its own shallow content
+    # dict and children list - not a deep copy of every reference, metadata dict and
+    # nested value. Node sharing is preserved: every original node maps to exactly one
+    # copy, and children/nodes/root are relinked to those copies.
+    """
+    copies: dict[int, ContextNode] = {}
+    originals: list[ContextNode] = []
+    pending: list[ContextNode] = [network.root, *network.nodes.values()]
+
+    while pending:
+        node = pending.pop()
+        if id(node) in copies:
+            continue
+        copies[id(node)] = node.model_copy(update={"content": dict(node.content), "children": []})
+        originals.append(node)
+        pending.extend(node.children)
+
+    for node in originals:
+        copies[id(node)].children = [copies[id(child)] for child in node.children]
+
+    return network.model_copy(
+        update={
+            "root": copies[id(network.root)],
+            "nodes": {node_id: copies[id(node)] for node_id, node in network.nodes.items()},
+        }
+    )
+
+
+def _substitute_root_only(network: NodeNetwork, variables: dict[str, Any]) -> NodeNetwork:
+    """Return a network whose root is a substituted copy; other nodes are left as-is."""
+    root = network.root.model_copy(update={"content": dict(network.root.content)})
+    root_name = _sanitize_path_segment(_extract_node_name(Path(str(root.id)).name))
+    _apply_variables_to_node(
+        node=root,
+        hierarchical_path=root_name,
+        variables=variables,
+        substitutor=VariableSubstitutor(),
+    )
+    return network.model_copy(update={"root": root})
+
+
 def _apply_variables_to_network(network: NodeNetwork, variables: dict[str, Any]) -> None:
     """Apply variable substitution to every node in the network copy."""
     if not variables:
@@ -393,26 +484,31 @@ def _apply_variables_to_network(network: NodeNetwork, variables: dict[str, Any])
     root_dir = root_path.parent
     root_name = _sanitize_path_segment(_extract_node_name(root_path.name))
 
-    def dfs(node: ContextNode) -> None:
-        node_id = str(node.id)
-        if node_id in visited:
-            return
-        visited.add(node_id)
-
-        node_path = Path(node_id)
-        hierarchical_path = _build_hierarchical_path(
-            node_path=node_path, root_dir=root_dir, root_path=root_path, root_name=root_name
-        )
+    # AICODE-NOTE: Pre-order DFS with an explicit stack instead of recursion, so deep
+    # networks cannot hit the interpreter recursion limit. Children are pushed in
+    # reverse to keep the original left-to-right visiting order.
+    def dfs(start: ContextNode) -> None:
+        stack = [start]
+        while stack:
+            node = stack.pop()
+            node_id = str(node.id)
+            if node_id in visited:
+                continue
+            visited.add(node_id)
+
+            node_path = Path(node_id)
+            hierarchical_path = _build_hierarchical_path(
+                node_path=node_path, root_dir=root_dir, root_path=root_path, root_name=root_name
+            )
 
-        _apply_variables_to_node(
-            node=node,
-            hierarchical_path=hierarchical_path,
-            variables=variables,
-            substitutor=substitutor,
-        )
+            _apply_variables_to_node(
+                node=node,
+                hierarchical_path=hierarchical_path,
+                variables=variables,
+                substitutor=substitutor,
+            )
 
-        for child in node.children:
-            dfs(child)
+            stack.extend(reversed(node.children))
 
     dfs(network.root)
 
@@ -432,42 +528,35 @@ def _apply_variables_to_node(
     if not variables:
         return
 
-    node_id = str(node.id)
-    node_name = _sanitize_path_segment(_extract_node_name(node_id))
+    node_name = _sanitize_path_segment(_extract_node_name(str(node.id)))
+
+    # Resolve scoped variables once per node, not once per string of structured content
+    node_variables = substitutor.resolver.resolve_variables_for_node(
+        variables, node_name, hierarchical_path
+    )
+    if not node_variables:
+        return
 
-    def build_context(content: str) -> SubstitutionContext:
-        return SubstitutionContext(
-            node_id=node_id,
-            node_name=node_name,
-            hierarchical_path=hierarchical_path,
-            content=content,
-            format=node.format,
-            variables=variables,
-        )
+    def substitute(content: str) -> str:
+        return substitutor.substitute_resolved(content, node.format, node_variables)
 
     if "raw_content" in node.content and isinstance(node.content["raw_content"], str):
-        node.content["raw_content"] = substitutor.substitute(
-            build_context(node.content["raw_content"])
-        )
+        node.content["raw_content"] = substitute(node.content["raw_content"])
     else:
-        node.content = _apply_variables_to_structure(node.content, build_context, substitutor)
+        node.content = _apply_variables_to_structure(node.content, substitute)
 
 
-def _apply_variables_to_structure(
-    value: Any,
-    context_factory: Callable[[str], SubstitutionContext],
-    substitutor: VariableSubstitutor,
-) -> Any:
+def _apply_variables_to_structure(value: Any, substitute: Callable[[str], str]) -> Any:
     """Recursively apply substitution to string values inside structured content."""
     if isinstance(value, str):
-        return substitutor.substitute(context_factory(value))
+        return substitute(value)
     if isinstance(value, dict):
         return {
-            key: _apply_variables_to_structure(sub_value, context_factory, substitutor)
+            key: _apply_variables_to_structure(sub_value, substitute)
             for key, sub_value in value.items()
         }
     if isinstance(value, list):
-        return [_apply_variables_to_structure(item, context_factory, substitutor) for item in value]
+        return [_apply_variables_to_structure(item, substitute) for item in value]
     return value
 
 
@@ -507,10 +596,8 @@ def _build_hierarchical_path(
 
 def _sanitize_path_segment(segment: str) -> str:
     """Sanitize filesystem segment names for variable scoping paths."""
-    import re
-
-    sanitized = re.sub(r"[^a-zA-Z0-9_]", "_", segment)
-    sanitized = re.sub(r"_+", "_", sanitized).strip("_")
+    sanitized = _UNSAFE_SEGMENT_CHARS.sub("_", segment)
+    sanitized = _REPEATED_UNDERSCORES.sub("_", sanitized).strip("_")
     if not sanitized:
         sanitized = "node"
     if sanitized[0].isdigit():
@@ -0,0 +1,5 @@
+"""Shared utilities used across promptic packages."""
+
+from promptic.utils.text_io import read_utf8_text
+
+__all__ = ["read_utf8_text"]
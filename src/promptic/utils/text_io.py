@@ -0,0 +1,31 @@
+"""Text file reading helpers for prompt files."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+
+def read_utf8_text(path: str | Path) -> str:
+    """
+    Read a UTF-8 text file with universal newline handling.
+
+    # AICODE-NOTE: Path.read_text() routes every read through io.TextIOWrapper,
+    # which decodes in chunks and translates newlines at Python level. Prompt
+    # files are small and read whole, so reading raw bytes (a single pre-sized
+    # read) and decoding once is cheaper. Newline translation is kept so the
+    # result stays identical to read_text() for files with CRLF/CR endings.
+
+    Args:
+        path: File path to read
+
+    Returns:
+        Decoded file content with "\\r\\n" and "\\r" normalized to "\\n"
+
+    Raises:
+        FileNotFoundError: If file does not exist
+        UnicodeDecodeError: If file content is not valid UTF-8
+    """
+    text = Path(path).read_bytes().decode("utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
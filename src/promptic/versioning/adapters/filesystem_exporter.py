@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import re
 import shutil
 from pathlib import Path
 from typing import Callable, Optional
 
+from promptic.utils.text_io import read_utf8_text
 from promptic.versioning.domain.errors import (
     ExportDirectoryConflictError,
     ExportDirectoryExistsError,
@@ -15,6 +17,9 @@ from promptic.versioning.utils.logging import get_logger, log_version_operation
 
 logger = get_logger(__name__)
 
+# Markdown link pattern [text](path/to/file.md), compiled once for all exported files
+_MARKDOWN_LINK_PATTERN = re.compile(r"\[([^\]]+)\]\(([^)]+)\)")
+
 
 class FileSystemExporter:
     """
@@ -97,6 +102,8 @@ class FileSystemExporter:
         target.mkdir(parents=True, exist_ok=True)
 
         exported_files: list[str] = []
+        # Directories known to exist; sibling files skip the repeated mkdir calls
+        ensured_dirs: set[Path] = {target}
 
         for source_file in source_files:
             source_path = Path(source_file)
@@ -114,13 +121,16 @@ class FileSystemExporter:
                 target_path = target / source_path.name
 
             # Create parent directories (critical for nested structure)
-            target_path.parent.mkdir(parents=True, exist_ok=True)
+            target_parent = target_path.parent
+            if target_parent not in ensured_dirs:
+                target_parent.mkdir(parents=True, exist_ok=True)
+                ensured_dirs.add(target_parent)
 
             # Copy file
             try:
                 if content_processor:
                     # Read, process, and write
-                    content = source_path.read_text(encoding="utf-8")
+                    content = read_utf8_text(source_path)
                     processed_content = content_processor(source_path, content)
                     target_path.write_text(processed_content, encoding="utf-8")
                 else:
@@ -164,14 +174,18 @@ class FileSystemExporter:
         Returns:
             Content with resolved path references
         """
-        import re
-
         resolved_content = content
         source_base_path = Path(source_base)
         target_base_path = Path(target_base)
+        # AICODE-NOTE: Resolved source path -> target path, built on the first local link.
+        # Each link used to resolve every mapping entry (a filesystem call per entry);
+        # now each entry is resolved once per call and links are matched by a dict probe.
+        # The first entry wins for sources resolving to the same file, as in the old scan.
+        targets_by_source: Optional[dict[Path, str]] = None
 
         # Pattern for markdown links: [text](path/to/file.md)
         def replace_markdown_link(match: re.Match) -> str:
+            nonlocal targets_by_source
             text = match.group(1)
             ref_path = match.group(2)
 
@@ -183,18 +197,22 @@ class FileSystemExporter:
             try:
                 source_ref = (source_base_path / ref_path).resolve()
                 # Find in file_mapping
-                for source_file, target_file in file_mapping.items():
-                    if Path(source_file).resolve() == source_ref:
-                        # Calculate relative path from target_base
-                        target_ref = Path(target_file)
-                        relative = target_ref.relative_to(target_base_path)
-                        return f"[{text}]({relative.as_posix()})"
+                if targets_by_source is None:
+                    index: dict[Path, str] = {}
+                    for source_file, target_file in file_mapping.items():
+                        index.setdefault(Path(source_file).resolve(), target_file)
+                    targets_by_source = index
+                mapped_target = targets_by_source.get(source_ref)
+                if mapped_target is not None:
+                    # Calculate relative path from target_base
+                    target_ref = Path(mapped_target)
+                    relative = target_ref.relative_to(target_base_path)
+                    return f"[{text}]({relative.as_posix()})"
             except Exception:
                 pass
 
             return str(match.group(0))
 
-        markdown_link_pattern = re.compile(r"\[([^\]]+)\]\(([^)]+)\)")
-        resolved_content = markdown_link_pattern.sub(replace_markdown_link, resolved_content)
+        resolved_content = _MARKDOWN_LINK_PATTERN.sub(replace_markdown_link, resolved_content)
 
         return resolved_content
@@ -23,7 +23,7 @@ if TYPE_CHECKING:
 logger = get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class VersionInfo:
     """
     Information about a versioned file.
@@ -34,6 +34,10 @@ class VersionInfo:
 
     Extended in 009-advanced-versioning to include classifiers field for
     supporting language/audience/environment classifiers.
+
+    # AICODE-NOTE: One VersionInfo (with its SemanticVersion) is created per file on
+    # every directory scan, so these records use __slots__ to keep them small and
+    # their field reads fast.
     """
 
     filename: str
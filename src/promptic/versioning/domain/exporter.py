@@ -3,12 +3,14 @@
 from __future__ import annotations
 
 import re
+from collections import deque
 from dataclasses import dataclass
 from pathlib import Path
 
 # Lazy import to avoid circular dependency
 from typing import TYPE_CHECKING, Any, Optional
 
+from promptic.utils.text_io import read_utf8_text
 from promptic.versioning.adapters.scanner import VersionedFileScanner
 from promptic.versioning.domain.errors import ExportDirectoryExistsError, ExportError
 from promptic.versioning.domain.resolver import VersionResolver, VersionSpec
@@ -20,6 +22,21 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+# AICODE-NOTE: Reference and version patterns are compiled once at import; they are
+# applied to every file read during discovery and every reference resolved.
+_MARKDOWN_LINK_PATTERN = re.compile(r"\[([^\]]+)\]\(([^)]+)\)")
+_INCLUDE_PATTERN = re.compile(r"(?:@include|include:)\s*\(?([^)]+)\)?", re.IGNORECASE)
+_VERSION_SUFFIX_PATTERN = re.compile(r"_v(\d+(?:\.\d+)*(?:\.\d+)?)")
+
+# Substitution format by file suffix; anything else is substituted as markdown
+_SUFFIX_FORMATS = {
+    ".yaml": "yaml",
+    ".yml": "yaml",
+    ".json": "json",
+    ".jinja": "jinja2",
+    ".jinja2": "jinja2",
+}
+
 
 @dataclass
 class ExportResult:
@@ -124,12 +141,18 @@ class VersionExporter:
         )
         root_path = Path(resolved_root)
 
+        # AICODE-NOTE: Both reference walks below read the same prompt files; sharing
+        # the decoded contents means each file is read once during discovery.
+        file_contents: dict[str, str] = {}
+
         # Step 2: Build hierarchical paths if vars present
-        hierarchical_paths = self._build_hierarchical_paths(str(root_path)) if vars else {}
+        hierarchical_paths = (
+            self._build_hierarchical_paths(str(root_path), file_contents) if vars else {}
+        )
 
         # Step 3: Build file mapping
         file_mapping = self._build_file_mapping(
-            root_path, source_base, target, version_spec, source_is_directory
+            root_path, source_base, target, version_spec, source_is_directory, file_contents
         )
 
         # Step 4: Create content processor
@@ -200,6 +223,7 @@ class VersionExporter:
         target: Path,
         version_spec: VersionSpec,
         source_is_directory: bool,
+        file_contents: Optional[dict[str, str]] = None,
     ) -> dict[str, str]:
         """
         Build source->target file mapping preserving directory structure.
@@ -216,6 +240,7 @@ class VersionExporter:
             target: Target export directory
             version_spec: Version specification for discovery
             source_is_directory: Whether original source was a directory (export whole tree)
+            file_contents: Optional cache of file contents shared with other discovery passes
 
         Returns:
             Dictionary mapping source paths to target paths
@@ -228,7 +253,9 @@ class VersionExporter:
         all_versioned_files: list[str] = []
         if source_is_directory:
             all_versioned_files = self.discover_versioned_files(str(source_base), version_spec)
-        referenced_files = self.discover_referenced_files(str(root_path), source_base)
+        referenced_files = self.discover_referenced_files(
+            str(root_path), source_base, file_contents
+        )
 
         # Process explicitly referenced files first
         for ref_file in referenced_files:
@@ -329,6 +356,13 @@ class VersionExporter:
         Returns:
             Callable that processes file content
         """
+        # AICODE-NOTE: One substitutor serves every exported file; it is stateless
+        # between calls, so it is created once here rather than per processed file.
+        substitutor = None
+        if vars:
+            from promptic.context.variables import VariableSubstitutor
+
+            substitutor = VariableSubstitutor()
 
         def content_processor(path: Path, content: str) -> str:
             # 1. Resolve paths
@@ -337,25 +371,18 @@ class VersionExporter:
             )
 
             # 2. Substitute variables if provided
-            if vars:
-                from promptic.context.variables import SubstitutionContext, VariableSubstitutor
+            if vars and substitutor is not None:
+                from promptic.context.variables import SubstitutionContext
 
                 node_id = str(path)
                 node_name = path.stem
-                version_match = re.search(r"_v(\d+(?:\.\d+)*(?:\.\d+)?)", node_name)
+                version_match = _VERSION_SUFFIX_PATTERN.search(node_name)
                 if version_match:
                     node_name = node_name.replace(version_match.group(0), "")
 
                 hier_path = hierarchical_paths.get(str(path), node_name)
 
-                ext = path.suffix.lower()
-                fmt = "markdown"
-                if ext in {".yaml", ".yml"}:
-                    fmt = "yaml"
-                elif ext == ".json":
-                    fmt = "json"
-                elif ext in {".jinja", ".jinja2"}:
-                    fmt = "jinja2"
+                fmt = _SUFFIX_FORMATS.get(path.suffix.lower(), "markdown")
 
                 context = SubstitutionContext(
                     node_id=node_id,
@@ -365,7 +392,6 @@ class VersionExporter:
                     format=fmt,
                     variables=vars,
                 )
-                substitutor = VariableSubstitutor()
                 return substitutor.substitute(context)
 
             return resolved
@@ -411,11 +437,9 @@ class VersionExporter:
             # Read processed root content
             exported_root_path = file_mapping.get(str(root_path))
             if exported_root_path and Path(exported_root_path).exists():
-                resolved_content = Path(exported_root_path).read_text(encoding="utf-8")
+                resolved_content = read_utf8_text(exported_root_path)
             else:
-                resolved_content = content_processor(
-                    root_path, root_path.read_text(encoding="utf-8")
-                )
+                resolved_content = content_processor(root_path, read_utf8_text(root_path))
 
             log_version_operation(
                 logger,
@@ -449,12 +473,15 @@ class VersionExporter:
                 message=f"Export failed: {e}",
             ) from e
 
-    def _build_hierarchical_paths(self, root_path: str) -> dict[str, str]:
+    def _build_hierarchical_paths(
+        self, root_path: str, file_contents: Optional[dict[str, str]] = None
+    ) -> dict[str, str]:
         """
         Build hierarchical path mapping for files in the prompt network.
 
         Args:
             root_path: Path to root prompt file
+            file_contents: Optional cache of file contents shared with other discovery passes
 
         Returns:
             Dictionary mapping absolute file paths to hierarchical dot-notation paths
@@ -466,7 +493,7 @@ class VersionExporter:
         def get_node_name(path: Path) -> str:
             stem = path.stem
             # Remove version suffix
-            version_match = re.search(r"_v(\d+(?:\.\d+)*(?:\.\d+)?)", stem)
+            version_match = _VERSION_SUFFIX_PATTERN.search(stem)
             if version_match:
                 return stem.replace(version_match.group(0), "")
             return stem
@@ -479,32 +506,31 @@ class VersionExporter:
         hierarchical_paths[str(root.resolve())] = root_name
 
         # Queue: (current_path, current_hier_path)
-        to_process: list[tuple[Path, str]] = [(root, root_name)]
+        # AICODE-NOTE: deque keeps BFS pops O(1); list.pop(0) shifts the whole queue.
+        to_process: deque[tuple[Path, str]] = deque([(root, root_name)])
         processed: set[str] = set()
 
         while to_process:
-            current_path, current_hier_path = to_process.pop(0)
+            current_path, current_hier_path = to_process.popleft()
             if str(current_path) in processed:
                 continue
             processed.add(str(current_path))
 
             try:
-                content = current_path.read_text(encoding="utf-8")
+                content = self._read_file(current_path, file_contents)
 
                 base_dir = current_path.parent
 
                 # Find references
                 refs = []
                 # Markdown links
-                for match in re.finditer(r"\[([^\]]+)\]\(([^)]+)\)", content):
+                for match in _MARKDOWN_LINK_PATTERN.finditer(content):
                     ref_str = match.group(2)
                     if not ref_str.startswith(("http://", "https://", "#")):
                         refs.append(ref_str)
 
                 # Include directives
-                for match in re.finditer(
-                    r"(?:@include|include:)\s*\(?([^)]+)\)?", content, re.IGNORECASE
-                ):
+                for match in _INCLUDE_PATTERN.finditer(content):
                     refs.append(match.group(1).strip())
 
                 for ref_str in refs:
@@ -570,7 +596,10 @@ class VersionExporter:
         return []
 
     def discover_referenced_files(
-        self, prompt_path: str, source_base: Path | None = None
+        self,
+        prompt_path: str,
+        source_base: Path | None = None,
+        file_contents: Optional[dict[str, str]] = None,
     ) -> list[str]:
         """
         Discover all files referenced by the prompt hierarchy.
@@ -584,16 +613,17 @@ class VersionExporter:
         Args:
             prompt_path: Path to root prompt file
             source_base: Optional root directory for resolving paths from root prompt
+            file_contents: Optional cache of file contents shared with other discovery passes
 
         Returns:
             List of referenced file paths
         """
         discovered: set[str] = set()
-        to_process: list[str] = [prompt_path]
+        to_process: deque[str] = deque([prompt_path])
         processed: set[str] = set()
 
         while to_process:
-            current = to_process.pop(0)
+            current = to_process.popleft()
             if current in processed:
                 continue
             processed.add(current)
@@ -604,7 +634,7 @@ class VersionExporter:
 
             # Read file content and extract references
             try:
-                content = path.read_text(encoding="utf-8")
+                content = self._read_file(path, file_contents)
                 references = self._extract_references(content, path, source_base)
 
                 for ref in references:
@@ -617,6 +647,18 @@ class VersionExporter:
 
         return list(discovered)
 
+    @staticmethod
+    def _read_file(path: Path, file_contents: Optional[dict[str, str]]) -> str:
+        """Read a prompt file, reusing contents already read during this export."""
+        if file_contents is None:
+            return read_utf8_text(path)
+        key = str(path)
+        content = file_contents.get(key)
+        if content is None:
+            content = read_utf8_text(path)
+            file_contents[key] = content
+        return content
+
     def _extract_references(
         self, content: str, base_path: Path, source_base: Path | None = None
     ) -> list[str]:
@@ -631,8 +673,7 @@ class VersionExporter:
         base_dir = base_path.parent
 
         # Pattern for markdown links: [text](path/to/file.md)
-        markdown_link_pattern = re.compile(r"\[([^\]]+)\]\(([^)]+)\)")
-        for match in markdown_link_pattern.finditer(content):
+        for match in _MARKDOWN_LINK_PATTERN.finditer(content):
             ref_path = match.group(2)
             # Skip URLs and anchors
             if ref_path.startswith(("http://", "https://", "#")):
@@ -642,8 +683,7 @@ class VersionExporter:
                 references.append(resolved)
 
         # Pattern for include directives: @include(path/to/file.md) or include: path/to/file.md
-        include_pattern = re.compile(r"(?:@include|include:)\s*\(?([^)]+)\)?", re.IGNORECASE)
-        for match in include_pattern.finditer(content):
+        for match in _INCLUDE_PATTERN.finditer(content):
             ref_path = match.group(1).strip()
             resolved = self._resolve_reference_path(ref_path, base_dir, source_base)
             if resolved:
@@ -780,7 +820,7 @@ class VersionExporter:
                         resolved_name.rsplit(".", 1)[0] if "." in resolved_name else resolved_name
                     )
                     # Remove version suffix from resolved base name
-                    version_match = re.search(r"_v(\d+(?:\.\d+)*(?:\.\d+)?)", resolved_base)
+                    version_match = _VERSION_SUFFIX_PATTERN.search(resolved_base)
                     if version_match:
                         resolved_base = resolved_base.replace(version_match.group(0), "")
                     # Check if base names match
@@ -809,7 +849,7 @@ class VersionExporter:
             return ""
 
         # Fallback to default underscore pattern
-        version_match = re.search(r"_v(\d+(?:\.\d+)*(?:\.\d+)?)", name)
+        version_match = _VERSION_SUFFIX_PATTERN.search(name)
         if version_match:
             return version_match.group(0)
         return ""
@@ -23,7 +23,7 @@ if TYPE_CHECKING:
     from promptic.versioning.config import VersioningConfig
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class VersionComponents:
     """
     Extracted version components from a filename.
@@ -13,6 +13,22 @@ from typing import Any, Dict
 # AICODE-NOTE: Removed dead import of ContextEngineSettings (only used by blueprints/adapters)
 
 
+# Operation types logged below INFO / above INFO; everything else is logged at INFO
+_DEBUG_OPERATIONS = frozenset(
+    {
+        "config_loaded",
+        "pattern_compiled",
+        "classifier_matched",
+        "directory_scanned",
+    }
+)
+_WARNING_OPERATIONS = frozenset(
+    {
+        "prerelease_only_warning",
+    }
+)
+
+
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger configured for versioning operations.
@@ -72,6 +88,19 @@ def log_version_operation(
         path: File or directory path (optional)
         **kwargs: Additional structured fields to log
     """
+    # AICODE-NOTE: The level is decided before any formatting. Debug operations are
+    # emitted per file inside scanner loops, and with the default INFO level they used
+    # to build (and then discard) a formatted message for every file.
+    if operation in _DEBUG_OPERATIONS:
+        level = logging.DEBUG
+    elif operation in _WARNING_OPERATIONS:
+        level = logging.WARNING
+    else:
+        level = logging.INFO
+
+    if not logger.isEnabledFor(level):
+        return
+
     fields: Dict[str, Any] = {
         "operation": operation,
     }
@@ -83,21 +112,4 @@ def log_version_operation(
 
     # Format as structured log message
     field_str = ", ".join(f"{k}={v}" for k, v in fields.items())
-
-    # Determine log level based on operation type
-    debug_operations = {
-        "config_loaded",
-        "pattern_compiled",
-        "classifier_matched",
-        "directory_scanned",
-    }
-    warning_operations = {
-        "prerelease_only_warning",
-    }
-
-    if operation in debug_operations:
-        logger.debug(f"Versioning operation: {field_str}")
-    elif operation in warning_operations:
-        logger.warning(f"Versioning operation: {field_str}")
-    else:
-        logger.info(f"Versioning operation: {field_str}")
+    logger.log(level, f"Versioning operation: {field_str}")
@@ -24,6 +24,11 @@ class PromptPathResolver:
         self._config = versioning_config
         self._scanner = VersionedFileScanner(config=versioning_config)
 
+    @property
+    def scanner(self) -> VersionedFileScanner:
+        """Get the versioned file scanner used for resolution."""
+        return self._scanner
+
     def resolve(
         self,
         raw_path: str | Path,
@@ -61,16 +66,16 @@ class PromptPathResolver:
         relative_hint = path_obj.parts if not path_obj.is_absolute() else None
         candidate = self._make_absolute(path_obj, anchor_dir)
 
-        if candidate.exists():
-            if candidate.is_file():
-                return candidate
-            if candidate.is_dir():
-                return self._resolve_from_directory(
-                    candidate,
-                    version_spec,
-                    default_version,
-                    classifier,
-                )
+        # is_file()/is_dir() are False for missing paths, so no separate exists() stat
+        if candidate.is_file():
+            return candidate
+        if candidate.is_dir():
+            return self._resolve_from_directory(
+                candidate,
+                version_spec,
+                default_version,
+                classifier,
+            )
 
         return self._resolve_from_parent(
             candidate,
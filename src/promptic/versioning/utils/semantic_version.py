@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
 from typing import Optional
 
 from packaging.version import InvalidVersion, Version
 
+_PRERELEASE_PATTERN = re.compile(r"([a-zA-Z]+)\.?(\d+)?")
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class SemanticVersion:
     """
     Represents a semantic version (major.minor.patch) with optional prerelease.
@@ -167,9 +170,7 @@ class SemanticVersion:
         def parse_prerelease(pre: str) -> tuple[str, int]:
             """Parse prerelease into (label, number)."""
             # Handle formats like "alpha", "alpha.1", "beta.2", "rc1"
-            import re
-
-            match = re.match(r"([a-zA-Z]+)\.?(\d+)?", pre)
+            match = _PRERELEASE_PATTERN.match(pre)
             if match:
                 label = match.group(1).lower()
                 num = int(match.group(2)) if match.group(2) else 0
@@ -0,0 +1,43 @@
+"""Shared fixtures for rendering benchmarks."""
+
+import pytest
+
+from promptic.context.nodes.models import ContextNode, NodeNetwork, NodeReference
+
+LEAF_COUNT = 1000
+LINKED_LEAVES = 500
+
+
+def _text_node(node_id: str, text: str, links: list[str]) -> ContextNode:
+    return ContextNode(
+        id=node_id,
+        content={"raw_content": text},
+        format="markdown",
+        references=[
+            NodeReference(path=link, type="file", resolved_path=f"/bench/{link}") for link in links
+        ],
+    )
+
+
+@pytest.fixture(scope="session")
+def large_network() -> NodeNetwork:
+    """Network of a root and 1000 markdown leaves with 500 cross-references.
+
+    The root links to the first 500 leaves; each of those links to a leaf in the
+    second half, so every rendered reference resolves one level deeper.
+    """
+    nodes: dict[str, ContextNode] = {}
+    for i in range(LEAF_COUNT):
+        links = [f"leaf_{i + LINKED_LEAVES}.md"] if i < LINKED_LEAVES else []
+        text = f"# Leaf {i}\n\n" + "".join(f"See [next]({link}).\n" for link in links)
+        node = _text_node(f"/bench/leaf_{i}.md", text, links)
+        nodes[str(node.id)] = node
+
+    root_links = [f"leaf_{i}.md" for i in range(LINKED_LEAVES)]
+    root = _text_node(
+        "/bench/root.md",
+        "# Root\n\n" + "".join(f"- [leaf]({link})\n" for link in root_links),
+        root_links,
+    )
+    nodes[str(root.id)] = root
+    return NodeNetwork(root=root, nodes=nodes, total_size=len(nodes), depth=3)
@@ -0,0 +1,44 @@
+"""Rendering throughput benchmarks.
+
+# AICODE-NOTE: Run with `pytest tests/benchmarks --benchmark-only` and keep the JSON
+# output (`--benchmark-json=out.json`) to compare runs; the module is skipped when
+# pytest-benchmark is not installed.
+"""
+
+import pytest
+
+from promptic.rendering.inliner import ReferenceInliner
+from promptic.rendering.pipeline import RenderingPipeline
+
+pytest.importorskip("pytest_benchmark")
+
+pytestmark = pytest.mark.benchmark
+
+
+def test_default_pipeline_markdown(benchmark, large_network):
+    """Benchmark the default pipeline rendering the whole network to markdown."""
+    result = benchmark(
+        lambda: RenderingPipeline.default().execute(large_network.root, large_network, "markdown")
+    )
+
+    assert result.count("# Leaf") == 1000
+
+
+def test_inline_references_markdown(benchmark, large_network):
+    """Benchmark inlining references of the root node directly."""
+    inliner = ReferenceInliner()
+
+    result = benchmark(
+        lambda: inliner.inline_references(large_network.root, large_network, "markdown")
+    )
+
+    assert "[leaf]" not in result
+
+
+def test_find_node_benchmark(benchmark, large_network):
+    """Benchmark the fallback lookup of a path that is not a full node ID."""
+    inliner = ReferenceInliner()
+
+    node = benchmark(lambda: inliner._find_node("leaf_999.md", large_network))
+
+    assert node is not None and node.id == "/bench/leaf_999.md"
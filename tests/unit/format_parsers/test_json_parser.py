@@ -1,5 +1,6 @@
 """Unit tests for JSON parser."""
 
+import math
 from pathlib import Path
 
 import pytest
@@ -51,3 +52,33 @@ def test_json_parser_invalid_json_raises_error():
 
     with pytest.raises(FormatParseError):
         parser.parse(content, path)
+
+
+def test_json_parser_wraps_non_dict_content():
+    """Test JSON parser wraps non-object top-level values and keeps unicode text."""
+    parser = JSONParser()
+    path = Path("test.json")
+
+    assert parser.parse('["привет", 1]', path) == {"content": ["привет", 1]}
+    assert parser.parse("null", path) == {}
+
+
+def test_json_parser_accepts_non_finite_literals():
+    """Test JSON parser keeps accepting NaN / Infinity literals like json.loads."""
+    parser = JSONParser()
+
+    parsed = parser.parse('{"a": NaN, "b": Infinity, "c": -Infinity}', Path("test.json"))
+
+    assert math.isnan(parsed["a"])
+    assert parsed["b"] == math.inf
+    assert parsed["c"] == -math.inf
+
+
+def test_json_parser_keeps_big_integers_exact():
+    """Test JSON parser does not turn integers beyond 64 bits into floats."""
+    parser = JSONParser()
+
+    parsed = parser.parse('{"big": 123456789012345678901234567890}', Path("test.json"))
+
+    assert parsed["big"] == 123456789012345678901234567890
+    assert isinstance(parsed["big"], int)
@@ -0,0 +1,66 @@
+"""Unit tests for format parser registry."""
+
+from pathlib import Path
+
+import pytest
+
+from promptic.context.nodes.errors import FormatDetectionError
+from promptic.format_parsers.json_parser import JSONParser
+from promptic.format_parsers.markdown_parser import MarkdownParser
+from promptic.format_parsers.registry import FormatParserRegistry, get_default_registry
+
+
+@pytest.mark.parametrize(
+    "filename,expected_format",
+    [
+        ("prompt.yaml", "yaml"),
+        ("prompt.YML", "yaml"),
+        ("prompt.md", "markdown"),
+        ("prompt.markdown", "markdown"),
+        ("prompt.jinja2", "jinja2"),
+        ("prompt.json", "json"),
+    ],
+)
+def test_detect_parser_by_extension(filename, expected_format):
+    """Test detect_parser returns the registered parser for known extensions."""
+    registry = get_default_registry()
+
+    format_name, parser = registry.detect_parser("", Path(filename))
+
+    assert format_name == expected_format
+    assert parser is registry.get_parser(expected_format)
+    assert registry.detect_format("", Path(filename)) == expected_format
+
+
+def test_detect_parser_unknown_extension_raises():
+    """Test detect_parser raises FormatDetectionError for unknown extensions."""
+    registry = get_default_registry()
+
+    with pytest.raises(FormatDetectionError):
+        registry.detect_parser("plain text", Path("notes.txt"))
+
+
+def test_reregistering_format_replaces_extension_parser():
+    """Test re-registering a format updates the parser returned for its extensions."""
+    registry = FormatParserRegistry()
+    registry.register("markdown", MarkdownParser(), [".md"])
+    replacement = MarkdownParser()
+    registry.register("markdown", replacement, [".markdown"])
+
+    assert registry.detect_parser("", Path("a.md"))[1] is replacement
+    assert registry.detect_parser("", Path("a.markdown"))[1] is replacement
+
+
+def test_detect_parser_falls_back_when_extension_parser_rejects():
+    """Test content-based fallback runs when the extension's parser rejects the file."""
+
+    class AnyJSONParser(JSONParser):
+        def detect(self, content, path):
+            return content.lstrip().startswith("{")
+
+    registry = FormatParserRegistry()
+    registry.register("markdown", MarkdownParser(), [".txt"])
+    json_parser = AnyJSONParser()
+    registry.register("json", json_parser, [".json"])
+
+    assert registry.detect_parser('{"a": 1}', Path("data.txt")) == ("json", json_parser)
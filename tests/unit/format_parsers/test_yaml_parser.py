@@ -69,3 +69,27 @@ def test_yaml_parser_invalid_yaml_raises_error():
 
     with pytest.raises(FormatParseError):
         parser.parse(content, path)
+
+
+def test_yaml_parser_rejects_python_object_tags():
+    """Test YAML parser only accepts the safe schema."""
+    parser = YAMLParser()
+    content = "value: !!python/object/apply:os.getcwd []"
+    path = Path("test.yaml")
+
+    with pytest.raises(FormatParseError):
+        parser.parse(content, path)
+
+
+def test_yaml_parser_extract_references():
+    """Test YAML parser extracts $ref keys and "$ref:" string values."""
+    parser = YAMLParser()
+    parsed = {
+        "steps": [{"$ref": "instructions/analyze.md"}, {"name": "plain"}],
+        "data": "$REF: data/sources.json",
+    }
+
+    refs = parser.extract_references(parsed)
+
+    assert [ref.path for ref in refs] == ["instructions/analyze.md", "data/sources.json"]
+    assert all(ref.type == "file" for ref in refs)
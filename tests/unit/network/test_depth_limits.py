@@ -5,86 +5,65 @@ from pathlib import Path
 import pytest
 
 from promptic.context.nodes.errors import NodeNetworkDepthExceededError
-from promptic.context.nodes.models import ContextNode, NetworkConfig, NodeReference
+from promptic.context.nodes.models import NetworkConfig
+from promptic.pipeline.network.builder import NodeNetworkBuilder
 
 
-def test_depth_limit_enforcement_exceeds_limit():
+def _write_chain(root: Path, length: int) -> Path:
+    """Write a markdown chain n0.md -> n1.md -> ... and return the first file."""
+    for i in range(length):
+        link = f"[next](n{i + 1}.md)\n" if i + 1 < length else ""
+        (root / f"n{i}.md").write_text(f"# Node {i}\n\n{link}", encoding="utf-8")
+    return root / "n0.md"
+
+
+def test_depth_limit_enforcement_exceeds_limit(tmp_path):
     """Test that NodeNetworkDepthExceededError is raised when depth exceeded."""
-    # This test will fail until depth limit enforcement is implemented
-    # Create a deep chain of nodes exceeding max_depth
-    config = NetworkConfig(max_depth=2)
-
-    # Create nodes with depth 3 (exceeds limit of 2)
-    # node_a -> node_b -> node_c
-    node_a = ContextNode(
-        id="a",
-        content={"name": "Node A"},
-        format="yaml",
-        references=[NodeReference(path="b", type="file")],
-    )
-    node_b = ContextNode(
-        id="b",
-        content={"name": "Node B"},
-        format="yaml",
-        references=[NodeReference(path="c", type="file")],
-    )
-    node_c = ContextNode(
-        id="c",
-        content={"name": "Node C"},
-        format="yaml",
-        references=[],
-    )
-
-    # Depth limit enforcement should raise NodeNetworkDepthExceededError
-    # TODO: Implement depth limit enforcement and update this test
-    pass
-
-
-def test_depth_limit_enforcement_within_limit():
+    # n0 -> n1 -> n2 -> n3: the deepest reference is 3 levels below the root
+    root = _write_chain(tmp_path, 4)
+
+    with pytest.raises(NodeNetworkDepthExceededError):
+        NodeNetworkBuilder().build_network(root, NetworkConfig(max_depth=2))
+
+
+def test_depth_limit_enforcement_within_limit(tmp_path):
     """Test that network within depth limit passes validation."""
-    # This test will fail until depth limit enforcement is implemented
-    config = NetworkConfig(max_depth=3)
-
-    # Create nodes with depth 2 (within limit of 3)
-    # node_a -> node_b
-    node_a = ContextNode(
-        id="a",
-        content={"name": "Node A"},
-        format="yaml",
-        references=[NodeReference(path="b", type="file")],
-    )
-    node_b = ContextNode(
-        id="b",
-        content={"name": "Node B"},
-        format="yaml",
-        references=[],
-    )
-
-    # Depth limit enforcement should pass
-    # TODO: Implement depth limit enforcement and update this test
-    pass
-
-
-def test_depth_limit_enforcement_at_limit():
+    root = _write_chain(tmp_path, 2)
+
+    network = NodeNetworkBuilder().build_network(root, NetworkConfig(max_depth=3))
+
+    assert len(network.nodes) == 2
+    assert network.depth == 2
+
+
+def test_depth_limit_enforcement_at_limit(tmp_path):
     """Test that network exactly at depth limit passes validation."""
-    # This test will fail until depth limit enforcement is implemented
-    config = NetworkConfig(max_depth=2)
-
-    # Create nodes with depth 2 (exactly at limit)
-    # node_a -> node_b
-    node_a = ContextNode(
-        id="a",
-        content={"name": "Node A"},
-        format="yaml",
-        references=[NodeReference(path="b", type="file")],
-    )
-    node_b = ContextNode(
-        id="b",
-        content={"name": "Node B"},
-        format="yaml",
-        references=[],
-    )
-
-    # Depth limit enforcement should pass (limit is inclusive)
-    # TODO: Implement depth limit enforcement and update this test
-    pass
+    # n0 -> n1 -> n2: the deepest reference is exactly max_depth levels below the root
+    root = _write_chain(tmp_path, 3)
+
+    network = NodeNetworkBuilder().build_network(root, NetworkConfig(max_depth=2))
+
+    assert network.depth == 3
+    assert [Path(child.id).name for child in network.root.children] == ["n1.md"]
+
+
+def test_depth_uses_first_visit_of_shared_nodes(tmp_path):
+    """Test network depth follows traversal order when nodes are shared."""
+    (tmp_path / "root.md").write_text("[a](a.md)\n[c](c.md)\n", encoding="utf-8")
+    (tmp_path / "a.md").write_text("[b](b.md)\n", encoding="utf-8")
+    (tmp_path / "b.md").write_text("[c](c.md)\n", encoding="utf-8")
+    (tmp_path / "c.md").write_text("# Leaf\n", encoding="utf-8")
+
+    network = NodeNetworkBuilder().build_network(tmp_path / "root.md")
+
+    assert network.depth == 4
+
+
+def test_deep_chain_does_not_hit_recursion_limit(tmp_path):
+    """Test that long reference chains are traversed without recursion."""
+    root = _write_chain(tmp_path, 400)
+
+    network = NodeNetworkBuilder().build_network(root, NetworkConfig(max_depth=500))
+
+    assert len(network.nodes) == 400
+    assert network.depth == 400
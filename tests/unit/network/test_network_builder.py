@@ -2,26 +2,25 @@
 
 from pathlib import Path
 
+import orjson
 import pytest
+from pydantic import ValidationError
 
-from promptic.context.nodes.errors import NodeReferenceNotFoundError
+from promptic.context.nodes.errors import NodeReferenceNotFoundError, NodeResourceLimitExceededError
 from promptic.context.nodes.models import ContextNode, NetworkConfig, NodeReference
+from promptic.pipeline.network.builder import NodeNetworkBuilder, _content_size
+from promptic.resolvers.filesystem import FilesystemReferenceResolver
 
 
-def test_missing_reference_handling():
+def test_missing_reference_handling(tmp_path):
     """Test that NodeReferenceNotFoundError is raised for missing references."""
-    # This test will fail until reference validation is implemented
-    # Create node with reference to non-existent node
-    node_a = ContextNode(
-        id="a",
-        content={"name": "Node A"},
-        format="yaml",
-        references=[NodeReference(path="nonexistent.md", type="file")],
-    )
+    (tmp_path / "a.md").write_text("[missing](nonexistent.md)\n", encoding="utf-8")
 
-    # Reference validation should raise NodeReferenceNotFoundError
-    # TODO: Implement reference validation and update this test
-    pass
+    with pytest.raises(NodeReferenceNotFoundError) as exc_info:
+        NodeNetworkBuilder().build_network(tmp_path / "a.md")
+
+    assert exc_info.value.reference_path == "nonexistent.md"
+    assert "nonexistent.md" in str(exc_info.value)
 
 
 def test_network_building_success():
@@ -81,3 +80,132 @@ def test_semantic_type_optional_metadata():
     assert node_with_semantic.references == []
     assert node_without_semantic.children == []
     assert node_with_semantic.children == []
+
+
+def test_network_config_is_immutable():
+    """Test that NetworkConfig instances are frozen value objects."""
+    config = NetworkConfig(max_depth=5)
+
+    with pytest.raises(ValidationError):
+        config.max_depth = 6  # type: ignore[misc]
+    assert config == NetworkConfig(max_depth=5)
+    assert hash(config) == hash(NetworkConfig(max_depth=5))
+
+
+def test_network_total_size_sums_node_sizes(tmp_path):
+    """Test that total_size is the sum of the serialized node sizes."""
+    (tmp_path / "a.md").write_text("# A\n\n[b](b.md)\n", encoding="utf-8")
+    (tmp_path / "b.md").write_text("# Б\n", encoding="utf-8")
+
+    network = NodeNetworkBuilder().build_network(tmp_path / "a.md")
+
+    expected = sum(len(orjson.dumps(node.content)) for node in network.nodes.values())
+    assert network.total_size == expected
+
+
+def test_node_size_limit_enforced(tmp_path):
+    """Test that NodeResourceLimitExceededError reports the oversized node."""
+    (tmp_path / "a.md").write_text("# A\n\n[b](b.md)\n", encoding="utf-8")
+    (tmp_path / "b.md").write_text("x" * 500, encoding="utf-8")
+
+    with pytest.raises(NodeResourceLimitExceededError) as exc_info:
+        NodeNetworkBuilder().build_network(tmp_path / "a.md", NetworkConfig(max_node_size=200))
+
+    assert exc_info.value.limit_type == "node_size"
+    assert exc_info.value.current_value > 200
+
+
+def test_shared_reference_resolved_once_per_build(tmp_path):
+    """Test that a node referenced from several parents is loaded once and shared."""
+
+    class CountingResolver(FilesystemReferenceResolver):
+        def __init__(self):
+            super().__init__()
+            self.resolve_calls: list[str] = []
+
+        def resolve(self, path, base_path, version=None):
+            self.resolve_calls.append(path)
+            return super().resolve(path, base_path, version)
+
+    (tmp_path / "root.md").write_text("[a](a.md)\n[b](b.md)\n", encoding="utf-8")
+    (tmp_path / "a.md").write_text("[shared](shared.md)\n", encoding="utf-8")
+    (tmp_path / "b.md").write_text("[shared](shared.md)\n", encoding="utf-8")
+    (tmp_path / "shared.md").write_text("# Shared\n", encoding="utf-8")
+
+    resolver = CountingResolver()
+    network = NodeNetworkBuilder(resolver=resolver).build_network(tmp_path / "root.md")
+
+    assert resolver.resolve_calls.count("shared.md") == 1
+    node_a, node_b = network.root.children
+    assert node_a.children[0] is node_b.children[0]
+    assert node_b.references[0].resolved_path == str(node_b.children[0].id)
+
+
+def test_resolver_subclass_validate_override_is_honored(tmp_path):
+    """Test that a filesystem resolver subclass overriding validate() is still consulted."""
+
+    class DenyingResolver(FilesystemReferenceResolver):
+        def validate(self, path, base_path, version=None):
+            return False
+
+    (tmp_path / "root.md").write_text("[a](a.md)\n", encoding="utf-8")
+    (tmp_path / "a.md").write_text("# A\n", encoding="utf-8")
+
+    with pytest.raises(NodeReferenceNotFoundError):
+        NodeNetworkBuilder(resolver=DenyingResolver()).build_network(tmp_path / "root.md")
+
+
+@pytest.mark.parametrize(
+    "content,expected",
+    [
+        ({}, 2),
+        ({"raw_content": "plain ascii"}, len(b'{"raw_content":"plain ascii"}')),
+        ({"title": "Привет"}, len('{"title":"Привет"}'.encode("utf-8"))),
+        ({1: "one", "b": None}, len(b'{"1":"one","b":null}')),
+    ],
+)
+def test_content_size_is_compact_json_size(content, expected):
+    """Test that node size is the UTF-8 length of the compact JSON serialization."""
+    assert _content_size(content) == expected
+
+
+def test_content_size_falls_back_for_non_json_content():
+    """Test that content orjson cannot serialize is measured by its repr."""
+    content = {"tags": {"a"}}
+
+    assert _content_size(content) == len(str(content).encode("utf-8"))
+
+
+def test_duplicate_references_link_child_once(tmp_path):
+    """Test that a node referencing the same file twice gets a single child."""
+    (tmp_path / "a.md").write_text("[b](b.md)\n\nAgain: [b](b.md)\n", encoding="utf-8")
+    (tmp_path / "b.md").write_text("# B\n", encoding="utf-8")
+
+    network = NodeNetworkBuilder().build_network(tmp_path / "a.md")
+
+    assert len(network.root.references) == 2
+    assert [Path(child.id).name for child in network.root.children] == ["b.md"]
+
+
+def test_network_size_limit_enforced(tmp_path):
+    """Test that NodeResourceLimitExceededError is raised for too many nodes."""
+    (tmp_path / "a.md").write_text("[b](b.md)\n[c](c.md)\n", encoding="utf-8")
+    (tmp_path / "b.md").write_text("# B\n", encoding="utf-8")
+    (tmp_path / "c.md").write_text("# C\n", encoding="utf-8")
+
+    with pytest.raises(NodeResourceLimitExceededError) as exc_info:
+        NodeNetworkBuilder().build_network(tmp_path / "a.md", NetworkConfig(max_network_size=2))
+
+    assert exc_info.value.limit_type == "network_size"
+    assert exc_info.value.current_value == 3
+
+
+def test_resource_limit_aborts_traversal_early(tmp_path):
+    """Test that an oversized node stops the build before later references are resolved."""
+    (tmp_path / "a.md").write_text("[big](big.md)\n[missing](missing.md)\n", encoding="utf-8")
+    (tmp_path / "big.md").write_text("x" * 500, encoding="utf-8")
+
+    with pytest.raises(NodeResourceLimitExceededError) as exc_info:
+        NodeNetworkBuilder().build_network(tmp_path / "a.md", NetworkConfig(max_node_size=200))
+
+    assert exc_info.value.limit_type == "node_size"
@@ -56,6 +56,23 @@ class TestRenderContext:
         assert new_context.content == "new content"
         assert new_context.node == context.node
 
+    def test_with_content_isolates_metadata(self):
+        """Test metadata updates on a derived context do not leak into the original."""
+        node = ContextNode(id="test", content={}, format="markdown")
+        network = NodeNetwork(root=node, nodes={"test": node}, total_size=1, depth=1)
+
+        context = RenderContext(
+            node=node, network=network, target_format="markdown", metadata={"stage": "a"}
+        )
+        derived = context.with_content("x")
+        derived.metadata["stage"] = "b"
+        empty = RenderContext(node=node, network=network, target_format="markdown")
+        empty.with_content("y").metadata["k"] = 1
+
+        assert context.metadata == {"stage": "a"}
+        assert empty.metadata == {}
+        assert not hasattr(context, "__dict__")
+
 
 class TestContentExtractorStage:
     """Test ContentExtractorStage."""
@@ -232,6 +249,16 @@ class TestRenderingPipeline:
         assert pipeline.stages[1].name == "reference_inlining"
         assert pipeline.stages[2].name == "format_converter"
 
+    def test_default_pipelines_are_independent(self):
+        """Test changes to one default pipeline or its stages do not affect another."""
+        first = RenderingPipeline.default()
+        second = RenderingPipeline.default()
+        first.stages[1].inliner.strategies.clear()
+        first.remove_stage("format_converter")
+
+        assert len(second.stages) == 3
+        assert len(second.stages[1].inliner.strategies) == 3
+
     def test_insert_stage(self):
         """Test inserting stage at specific position."""
         pipeline = RenderingPipeline()
@@ -124,6 +124,36 @@ class TestReferenceInlinerFindNode:
 
         assert result is None
 
+    def test_find_node_versioned_match(self):
+        """Test finding a versioned node by its unversioned path."""
+        inliner = ReferenceInliner()
+        nodes = {
+            "/project/other/task_v2.md": MockContextNode(
+                "/project/other/task_v2.md", {"raw_content": "Other"}
+            ),
+            "/project/prompts/task_v2.md": MockContextNode(
+                "/project/prompts/task_v2.md", {"raw_content": "Content"}
+            ),
+        }
+        network = MockNodeNetwork(nodes)
+
+        result = inliner._find_node("prompts/task.md", network)
+
+        assert result is not None
+        assert result.id == "/project/prompts/task_v2.md"
+        assert inliner._find_node("prompts/task.yaml", network) is None
+
+    def test_find_node_prefers_exact_id(self):
+        """Test an exact node ID wins over earlier nodes that merely contain the path."""
+        inliner = ReferenceInliner()
+        nodes = {
+            "docs/data.md": MockContextNode("docs/data.md", {"raw_content": "Data"}),
+            "a.md": MockContextNode("a.md", {"raw_content": "A"}),
+        }
+        network = MockNodeNetwork(nodes)
+
+        assert inliner._find_node("a.md", network).id == "a.md"
+
 
 class TestReferenceInlinerInlineReferences:
     """Unit tests for inline_references method."""
@@ -341,3 +371,113 @@ class TestReferenceInlinerFormatHandling:
         assert isinstance(result, str)
         # JSON should be wrapped in code block for markdown output
         assert "```json" in result or "key" in result
+
+
+class TestReferenceInlinerResolvedReferences:
+    """Unit tests for lookups driven by resolver metadata."""
+
+    def test_resolved_path_used_for_repeated_references(self):
+        """Test that resolved paths win over name matching and are looked up once."""
+        from promptic.context.nodes.models import ContextNode, NodeNetwork, NodeReference
+
+        inliner = ReferenceInliner()
+        root = ContextNode(
+            id="/p/root.md",
+            content={"raw_content": "[A](child.md)\n\n[B](child.md)"},
+            format="markdown",
+            references=[
+                NodeReference(path="child.md", type="file", resolved_path="/p/b/child.md"),
+                NodeReference(path="child.md", type="file", resolved_path="/p/b/child.md"),
+            ],
+        )
+        decoy = ContextNode(id="/p/a/child.md", content={"raw_content": "wrong"}, format="markdown")
+        child = ContextNode(id="/p/b/child.md", content={"raw_content": "right"}, format="markdown")
+        network = NodeNetwork(
+            root=root,
+            nodes={str(n.id): n for n in (root, decoy, child)},
+        )
+
+        inliner._find_node = MagicMock(side_effect=AssertionError("fallback not expected"))
+        result = inliner.inline_references(root, network, "markdown")
+
+        assert result.count("right") == 2
+        assert "wrong" not in result
+
+    def test_shared_child_rendered_once_per_call(self):
+        """Test a node referenced from several parents is rendered once per inline call."""
+        from promptic.context.nodes.models import ContextNode, NodeNetwork
+
+        def text_node(node_id: str, text: str) -> ContextNode:
+            return ContextNode(id=node_id, content={"raw_content": text}, format="markdown")
+
+        root = text_node("root.md", "[A](a.md) [B](b.md) [S](shared.md)")
+        nodes = [
+            root,
+            text_node("a.md", "A:[S](shared.md)"),
+            text_node("b.md", "B:[S](shared.md)"),
+            text_node("shared.md", "shared"),
+        ]
+        network = NodeNetwork(root=root, nodes={str(n.id): n for n in nodes})
+
+        inliner = ReferenceInliner()
+        rendered_ids = []
+        original = inliner._render_child_content
+
+        def spy(child, *args):
+            rendered_ids.append(child.id)
+            return original(child, *args)
+
+        inliner._render_child_content = spy
+        first = inliner.inline_references(root, network, "markdown")
+        second = inliner.inline_references(root, network, "markdown")
+
+        assert first == second == "A:shared B:shared shared"
+        assert rendered_ids.count("shared.md") == 2  # once per top-level call
+
+    def test_reference_free_text_skips_strategies(self):
+        """Test text without reference sentinels is returned before any strategy runs."""
+        from promptic.context.nodes.models import ContextNode, NodeNetwork
+
+        leaf = ContextNode(
+            id="leaf.md", content={"raw_content": "# Leaf\n\n[x] done"}, format="markdown"
+        )
+        network = NodeNetwork(root=leaf, nodes={"leaf.md": leaf})
+
+        inliner = ReferenceInliner()
+        for strategy in inliner.strategies:
+            strategy.can_process = MagicMock(side_effect=AssertionError("not expected"))
+
+        assert inliner.inline_references(leaf, network, "markdown") == "# Leaf\n\n[x] done"
+
+    def test_custom_strategies_always_run(self):
+        """Test the sentinel pre-check does not bypass custom strategies."""
+        from promptic.context.nodes.models import ContextNode, NodeNetwork
+
+        leaf = ContextNode(id="leaf.md", content={"raw_content": "plain"}, format="markdown")
+        network = NodeNetwork(root=leaf, nodes={"leaf.md": leaf})
+        strategy = MagicMock()
+        strategy.can_process.return_value = True
+        strategy.process_string.return_value = "custom"
+
+        result = ReferenceInliner(strategies=[strategy]).inline_references(
+            leaf, network, "markdown"
+        )
+
+        assert result == "custom"
+
+    def test_strategy_appended_after_construction_runs(self):
+        """Test strategies added to inliner.strategies later are not skipped by the pre-check."""
+        from promptic.context.nodes.models import ContextNode, NodeNetwork
+
+        leaf = ContextNode(id="leaf.md", content={"raw_content": "hi @inc"}, format="markdown")
+        network = NodeNetwork(root=leaf, nodes={"leaf.md": leaf})
+        strategy = MagicMock()
+        strategy.can_process.side_effect = lambda content: "@inc" in content
+        strategy.process_string.side_effect = lambda content, *args: content.replace(
+            "@inc", "INCLUDED"
+        )
+
+        inliner = ReferenceInliner()
+        inliner.strategies.append(strategy)
+
+        assert inliner.inline_references(leaf, network, "markdown") == "hi INCLUDED"
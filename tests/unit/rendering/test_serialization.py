@@ -0,0 +1,28 @@
+"""Unit tests for rendered JSON serialization."""
+
+import json
+
+import pytest
+
+from promptic.rendering.serialization import dump_json
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        {},
+        {"key": "value", "number": 123, "nested": {"list": [1, 2.5, True, None, []]}},
+        {"ключ": "значение", "emoji": "😀", "controls": "\x00\x1f\x7f "},
+        {1: "int key", None: "null key", 2.5: "float key"},
+        {"big": 2**70},
+        ["a", {"b": "c"}],
+        {"nan": float("nan"), "inf": float("inf"), "-inf": float("-inf")},
+        {"small": [1e-7, 1e-05, 0.0001, -2.5e-9], "none": None},
+        {1e-7: "small float key", "large": 1e16},
+    ],
+)
+def test_dump_json_matches_stdlib_indent(content):
+    """Test output is identical to json.dumps(content, indent=2)."""
+    assert dump_json(content) == json.dumps(content, indent=2)
@@ -68,6 +68,7 @@ class TestMarkdownLinkStrategy:
         assert not strategy.can_process("Plain text")
         assert not strategy.can_process("{# ref: file.md #}")
         assert not strategy.can_process('{"$ref": "file.yaml"}')
+        assert not strategy.can_process("[](empty-label.md)")  # "](" alone is not a link
         assert not strategy.can_process("")
 
     def test_can_process_non_string(self, strategy: MarkdownLinkStrategy):
@@ -123,6 +124,21 @@ class TestMarkdownLinkStrategy:
         result = strategy.process_string(content, lambda p: None, simple_renderer, "markdown")
         assert result == content
 
+    def test_external_links_never_looked_up(self, strategy: MarkdownLinkStrategy):
+        """Test external links are skipped by the pattern while local links resolve."""
+        looked_up = []
+
+        def lookup(path: str) -> Optional[MockNode]:
+            looked_up.append(path)
+            return MockNode("Local")
+
+        content = "[Web](https://example.com) [Mail](mailto:a@b.c) [Top](#top) [L](local.md)"
+        result = strategy.process_string(content, lookup, simple_renderer, "markdown")
+
+        assert result == "[Web](https://example.com) [Mail](mailto:a@b.c) [Top](#top) Local"
+        assert looked_up == ["local.md"]
+        assert not strategy.can_process("[Web](https://example.com)")
+
     def test_missing_reference_preserved(self, strategy: MarkdownLinkStrategy):
         """Test that missing references keep original link."""
         content = "[Missing](nonexistent.md)"
@@ -255,6 +271,15 @@ class TestStructuredRefStrategy:
         assert not strategy.can_process({"nested": {"key": "value"}})
         assert not strategy.can_process({})
 
+    def test_can_process_deeply_nested(self, strategy: StructuredRefStrategy):
+        """Test detection through nesting deeper than the recursion limit."""
+        content: dict = {"$ref": "file.yaml"}
+        for _ in range(2000):
+            content = {"level": content}
+        assert strategy.can_process(content)
+        assert strategy.can_process({"list": [{"other": {"inner": [{"$ref": "file.yaml"}]}}]})
+        assert not strategy.can_process({"list": [{"other": {"inner": [{"key": "v"}]}}]})
+
     def test_can_process_non_dict(self, strategy: StructuredRefStrategy):
         """Test with non-dict content."""
         assert not strategy.can_process("string")
@@ -344,6 +369,27 @@ class TestStructuredRefStrategy:
         assert result["items"][1] == {"other": "value"}
         assert result["items"][2] == "B"
 
+    def test_unchanged_subtrees_are_shared(self, strategy: StructuredRefStrategy):
+        """Test only containers on the path to a replacement are rebuilt."""
+        untouched = {"deep": {"keep": [1, 2]}}
+        items = [{"other": "value"}, {"$ref": "a.yaml"}]
+        content = {"untouched": untouched, "items": items}
+
+        lookup = create_lookup({"a.yaml": MockNode("A")})
+        result = strategy.process_structure(content, lookup, simple_renderer, "yaml")
+
+        assert result == {"untouched": untouched, "items": [{"other": "value"}, "A"]}
+        assert result["untouched"] is untouched
+        assert result["items"] is not items
+        assert result["items"][0] is items[0]
+        assert content["items"][1] == {"$ref": "a.yaml"}  # input not modified
+
+    def test_no_resolved_ref_returns_input(self, strategy: StructuredRefStrategy):
+        """Test content whose refs are all missing is returned without copying."""
+        content = {"data": {"$ref": "nonexistent.yaml"}, "list": [{"$ref": "x.yaml"}]}
+        result = strategy.process_structure(content, lambda p: None, simple_renderer, "yaml")
+        assert result is content
+
     def test_process_string_returns_unchanged(self, strategy: StructuredRefStrategy):
         """Test that process_string returns string unchanged."""
         content = '{"$ref": "file.yaml"}'
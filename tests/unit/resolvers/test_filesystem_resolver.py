@@ -87,3 +87,30 @@ def test_path_validation():
 
         # TODO: Implement FilesystemReferenceResolver and update this test
         pass
+
+
+def test_version_spec_applies_only_to_versioned_reference_names():
+    """Test version spec is kept for versioned names and dropped otherwise."""
+    from promptic.versioning.config import VersioningConfig
+
+    resolver = FilesystemReferenceResolver(versioning_config=VersioningConfig(delimiter="-"))
+
+    assert resolver._determine_version_spec("prompt-v1.md", "v2") == "v2"
+    assert resolver._determine_version_spec("prompt.md", "v2") is None
+    assert resolver._determine_version_spec("prompt_v1.md", "v2") is None
+    assert resolver._determine_version_spec("prompt-v1.md", None) is None
+
+
+def test_try_resolve_matches_validate_and_resolve(tmp_path):
+    """Test try_resolve loads valid references and returns None for invalid ones."""
+    (tmp_path / "prompt_v1.md").write_text("# V1", encoding="utf-8")
+    (tmp_path / "prompt_v2.md").write_text("# V2", encoding="utf-8")
+    resolver = FilesystemReferenceResolver(root=tmp_path)
+
+    node = resolver.try_resolve("prompt.md", tmp_path)
+
+    assert node is not None
+    assert node.id == resolver.resolve("prompt.md", tmp_path).id
+    assert node.content["raw_content"] == "# V2"
+    assert resolver.try_resolve("missing.md", tmp_path) is None
+    assert resolver.validate("missing.md", tmp_path) is False
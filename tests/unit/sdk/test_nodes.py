@@ -220,3 +220,176 @@ def test_network_rendering_to_file_first():
     assert len(rendered) > 0
     # TODO: Implement network rendering and update this test
     pass
+
+
+def test_network_rendering_with_vars_leaves_original_unchanged(tmp_path):
+    """Test variable substitution renders from a copy and keeps the source network intact."""
+    from promptic.sdk.nodes import load_node_network, render_node_network
+
+    (tmp_path / "root.md").write_text("Hi {{name}}\n\n[a](a.md)\n[b](b.md)\n", encoding="utf-8")
+    (tmp_path / "a.md").write_text("A {{name}} [shared](shared.md)\n", encoding="utf-8")
+    (tmp_path / "b.md").write_text("B [shared](shared.md)\n", encoding="utf-8")
+    (tmp_path / "shared.md").write_text("Shared {{name}}\n", encoding="utf-8")
+    network = load_node_network(tmp_path / "root.md")
+
+    rendered = render_node_network(network, "markdown", render_mode="full", vars={"name": "Kim"})
+
+    assert "Hi Kim" in rendered
+    assert rendered.count("Shared Kim") == 2
+    assert "{{name}}" not in rendered
+    assert network.root.content["raw_content"].startswith("Hi {{name}}")
+    assert all("Kim" not in node.content["raw_content"] for node in network.nodes.values())
+
+
+def test_apply_variables_handles_chains_deeper_than_recursion_limit(tmp_path):
+    """Test variables reach every node of a chain deeper than the recursion limit."""
+    from promptic.context.nodes.models import NetworkConfig
+    from promptic.sdk.nodes import _apply_variables_to_network, load_node_network
+
+    length = 1100
+    for i in range(length):
+        link = f"[next](n{i + 1}.md)\n" if i + 1 < length else ""
+        (tmp_path / f"n{i}.md").write_text(f"N{i} {{{{name}}}}\n{link}", encoding="utf-8")
+    network = load_node_network(
+        tmp_path / "n0.md", config=NetworkConfig(max_depth=length, max_network_size=length)
+    )
+
+    _apply_variables_to_network(network, {"name": "Z"})
+
+    assert all("{{name}}" not in node.content["raw_content"] for node in network.nodes.values())
+    assert network.root.content["raw_content"].startswith("N0 Z")
+
+
+def test_file_first_rendering_with_vars_substitutes_root_only(tmp_path, monkeypatch):
+    """Test file_first rendering substitutes the rendered root without touching children."""
+    import promptic.sdk.nodes as sdk_nodes
+
+    (tmp_path / "root.md").write_text("Hi {{name}} {{who}}\n\n[a](a.md)\n", encoding="utf-8")
+    (tmp_path / "a.md").write_text("A {{name}}\n", encoding="utf-8")
+    network = sdk_nodes.load_node_network(tmp_path / "root.md")
+
+    def fail(*args, **kwargs):
+        raise AssertionError("child nodes should not be substituted in file_first mode")
+
+    monkeypatch.setattr(sdk_nodes, "_apply_variables_to_network", fail)
+
+    rendered = sdk_nodes.render_node_network(
+        network, "markdown", vars={"name": "Kim", "root.who": "all", "a.who": "nobody"}
+    )
+
+    assert rendered.startswith("Hi Kim all")
+    assert network.root.content["raw_content"].startswith("Hi {{name}}")
+
+
+def test_structured_node_variables_resolved_once(monkeypatch):
+    """Test structured content resolves node variables once and substitutes every string."""
+    from promptic.context.variables import VariableSubstitutor
+    from promptic.context.variables.resolver import ScopeResolver
+    from promptic.sdk.nodes import _apply_variables_to_node
+
+    node = ContextNode(
+        id="config.yaml",
+        content={"title": "{{name}}", "steps": ["{{name}} one", {"who": "{{who}}"}], "n": 1},
+        format="yaml",
+    )
+    calls = []
+    original = ScopeResolver.resolve_variables_for_node
+
+    def counting(self, *args, **kwargs):
+        calls.append(args)
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(ScopeResolver, "resolve_variables_for_node", counting)
+
+    _apply_variables_to_node(
+        node=node,
+        hierarchical_path="root.config",
+        variables={"name": "Kim", "config.who": "me", "other.who": "you"},
+        substitutor=VariableSubstitutor(),
+    )
+
+    assert len(calls) == 1
+    assert node.content == {"title": "Kim", "steps": ["Kim one", {"who": "me"}], "n": 1}
+
+
+def test_load_node_missing_file_raises(tmp_path):
+    """Test loading a missing file raises FileNotFoundError naming the node path."""
+    missing = tmp_path / "missing.md"
+
+    with pytest.raises(FileNotFoundError, match="Node file not found"):
+        load_node(missing)
+
+
+def test_load_node_reuses_parse_but_returns_independent_nodes(tmp_path, monkeypatch):
+    """Test unchanged files are parsed once and each load returns its own node."""
+    from promptic.format_parsers.yaml_parser import YAMLParser
+
+    path = tmp_path / "data.yaml"
+    path.write_text("items:\n  - $ref: child.yaml\n", encoding="utf-8")
+    parse_calls = []
+    original_parse = YAMLParser.parse
+
+    def counting_parse(self, content, source):
+        parse_calls.append(source)
+        return original_parse(self, content, source)
+
+    monkeypatch.setattr(YAMLParser, "parse", counting_parse)
+
+    first = load_node(path)
+    first.content["items"].append("mutated")
+    first.references[0].resolved_path = "/elsewhere/child.yaml"
+    second = load_node(path)
+
+    assert len(parse_calls) == 1
+    assert second.content == {"items": [{"$ref": "child.yaml"}]}
+    assert second.references[0].resolved_path is None
+
+
+def test_load_node_reparses_changed_file(tmp_path):
+    """Test an edited file is parsed again instead of served from the cache."""
+    import os
+
+    path = tmp_path / "note.md"
+    path.write_text("# First\n", encoding="utf-8")
+    assert load_node(path).content["raw_content"] == "# First\n"
+
+    path.write_text("# Second, longer\n", encoding="utf-8")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert load_node(path).content["raw_content"] == "# Second, longer\n"
+
+
+def test_load_node_reparses_after_parser_registration(tmp_path):
+    """Test registering a parser invalidates parses cached with the previous parser."""
+    from promptic.format_parsers.registry import get_default_registry
+    from promptic.format_parsers.yaml_parser import YAMLParser
+
+    class TaggingYAMLParser(YAMLParser):
+        def to_json(self, parsed):
+            return {**super().to_json(parsed), "tagged": True}
+
+    path = tmp_path / "config.yaml"
+    path.write_text("name: Test\n", encoding="utf-8")
+    assert "tagged" not in load_node(path).content
+
+    registry = get_default_registry()
+    original = registry.get_parser("yaml")
+    registry.register("yaml", TaggingYAMLParser(), [".yaml", ".yml"])
+    try:
+        assert load_node(path).content == {"name": "Test", "tagged": True}
+    finally:
+        registry.register("yaml", original, [".yaml", ".yml"])
+
+    assert "tagged" not in load_node(path).content
+
+
+def test_load_node_normalizes_newlines_like_read_text(tmp_path):
+    """Test CRLF/CR line endings and non-ASCII text load as read_text would return them."""
+    path = tmp_path / "note.md"
+    path.write_bytes("# Заметка\r\n\r\nline\rend\n".encode("utf-8"))
+
+    node = load_node(path)
+
+    assert node.content["raw_content"] == path.read_text(encoding="utf-8")
+    assert node.content["raw_content"] == "# Заметка\n\nline\nend\n"
@@ -0,0 +1,38 @@
+"""Unit tests for text file reading helpers."""
+
+import pytest
+
+from promptic.utils.text_io import read_utf8_text
+
+pytestmark = pytest.mark.unit
+
+
+class TestReadUtf8Text:
+    """Test read_utf8_text helper."""
+
+    def test_reads_utf8_content(self, tmp_path):
+        """Test UTF-8 content is decoded correctly."""
+        path = tmp_path / "prompt.md"
+        path.write_bytes("# Задача\n\nПривет, мир!\n".encode("utf-8"))
+
+        assert read_utf8_text(path) == "# Задача\n\nПривет, мир!\n"
+
+    @pytest.mark.parametrize("raw", [b"a\r\nb\r\n", b"a\rb\r", b"a\nb\r\nc\rd"])
+    def test_matches_read_text_newline_handling(self, tmp_path, raw):
+        """Test newline translation matches Path.read_text()."""
+        path = tmp_path / "prompt.md"
+        path.write_bytes(raw)
+
+        assert read_utf8_text(path) == path.read_text(encoding="utf-8")
+
+    def test_accepts_string_path(self, tmp_path):
+        """Test string paths are accepted."""
+        path = tmp_path / "prompt.md"
+        path.write_text("content", encoding="utf-8")
+
+        assert read_utf8_text(str(path)) == "content"
+
+    def test_missing_file_raises(self, tmp_path):
+        """Test missing files raise FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            read_utf8_text(tmp_path / "missing.md")
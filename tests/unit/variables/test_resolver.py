@@ -3,7 +3,7 @@
 import pytest
 
 from promptic.context.variables.models import VariableScope
-from promptic.context.variables.resolver import ScopeResolver
+from promptic.context.variables.resolver import ScopeResolver, _parse_variable_name
 
 
 class TestScopeResolver:
@@ -39,6 +39,16 @@ class TestScopeResolver:
         assert var_name == "variable"
         assert path_or_node == "root.group.node"
 
+    def test_parse_is_shared_across_resolvers(self):
+        """Test repeated keys hit the shared parse cache, even from another resolver."""
+        first = self.resolver.parse_variable_name("root.group.shared_key")
+        hits = _parse_variable_name.cache_info().hits
+        second = ScopeResolver().parse_variable_name("root.group.shared_key")
+
+        assert first == (VariableScope.PATH, "shared_key", "root.group")
+        assert second == first
+        assert _parse_variable_name.cache_info().hits == hits + 1
+
     def test_simple_scope_matches_all_nodes(self):
         """Test that simple scope matches any node."""
         assert self.resolver.matches_node(VariableScope.SIMPLE, None, "any_node", "any.path")
@@ -165,3 +175,4 @@ class TestScopeResolver:
         assert not self.resolver.validate_variable_name("user-name")  # Contains dash
         assert not self.resolver.validate_variable_name("user name")  # Contains space
         assert not self.resolver.validate_variable_name("user.name")  # Contains dot
+        assert not self.resolver.validate_variable_name("user_name\n")  # Trailing newline
@@ -1,5 +1,7 @@
 """Unit tests for VariableSubstitutor."""
 
+import dataclasses
+
 import pytest
 
 from promptic.context.variables.models import SubstitutionContext
@@ -69,6 +71,20 @@ class TestVariableSubstitutor:
         result = self.substitutor.substitute(context)
         assert result == "Hello Diana, your {{undefined}} is waiting."
 
+    def test_substitute_values_are_not_rescanned(self):
+        """Test that markers inside substituted values are left as-is (single pass)."""
+        context = SubstitutionContext(
+            node_id="test.md",
+            node_name="test",
+            hierarchical_path="test",
+            content="{{a}} and {{b}}",
+            format="markdown",
+            variables={"a": "{{b}}", "b": "B"},
+        )
+
+        result = self.substitutor.substitute(context)
+        assert result == "{{b}} and B"
+
     def test_substitute_no_variables(self):
         """Test that content is unchanged when no variables provided."""
         context = SubstitutionContext(
@@ -223,3 +239,61 @@ class TestVariableSubstitutor:
         # DebugUndefined renders undefined as empty string
         assert "Hello Grace" in result
         assert "undefined" in result.lower()  # DebugUndefined includes debug info
+
+    def test_jinja2_repeated_content_renders_each_call_variables(self):
+        """Test reused Jinja2 templates render with the variables of each call."""
+        results = []
+        for name in ("Heidi", "Ivan"):
+            context = SubstitutionContext(
+                node_id="template.jinja2",
+                node_name="template",
+                hierarchical_path="root.template",
+                content="Hi {{ name }}!",
+                format="jinja2",
+                variables={"name": name},
+            )
+            results.append(self.substitutor.substitute(context))
+
+        assert results == ["Hi Heidi!", "Hi Ivan!"]
+
+    @pytest.mark.parametrize(
+        "content", ["plain", "plain\n", "a\n\nb\n\n", "\n", "", "a } b", "a\r\nb\r\n"]
+    )
+    def test_jinja2_content_without_syntax_matches_engine(self, content):
+        """Test syntax-free Jinja2 content renders exactly as the Jinja2 engine would."""
+        from promptic.context.variables.substitutor import _compile_jinja2_template
+
+        result = self.substitutor._substitute_jinja2(content, {"name": "Judy"})
+
+        assert result == _compile_jinja2_template(content).render(name="Judy")
+
+
+class TestSubstitutionContext:
+    """Test SubstitutionContext value object."""
+
+    def test_context_is_immutable(self):
+        """Test that substitution contexts are frozen and slotted."""
+        context = SubstitutionContext(
+            node_id="node.md",
+            node_name="node",
+            hierarchical_path="root.node",
+            content="Hello {{name}}",
+            format="markdown",
+            variables={"name": "Judy"},
+        )
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            context.content = "changed"  # type: ignore[misc]
+        assert not hasattr(context, "__dict__")
+
+    def test_context_rejects_empty_node_id(self):
+        """Test that validation still runs for frozen contexts."""
+        with pytest.raises(ValueError, match="node_id"):
+            SubstitutionContext(
+                node_id="",
+                node_name="node",
+                hierarchical_path="root.node",
+                content="",
+                format="markdown",
+                variables={},
+            )
@@ -53,6 +53,50 @@ class TestVersionExporter:
             assert (root / "root_prompt_v2.md").exists()
             assert (root / "instructions" / "process_v2.md").exists()
 
+    def test_hierarchical_paths_use_breadth_first_order(self):
+        """Test shared files get the hierarchical path of their shallowest reference."""
+        with TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            (root / "root.md").write_text("[a](a_v1.md)\n[b](b.md)\n")
+            (root / "a_v1.md").write_text("[b](b.md)\n[c](c.md)\n")
+            (root / "b.md").write_text("# B")
+            (root / "c.md").write_text("# C")
+
+            paths = VersionExporter()._build_hierarchical_paths(str(root / "root.md"))
+
+            assert {Path(p).name: h for p, h in paths.items()} == {
+                "root.md": "root",
+                "a_v1.md": "root.a",
+                "b.md": "root.b",
+                "c.md": "root.a.c",
+            }
+
+    def test_discovery_passes_share_file_contents(self):
+        """Test each file is read once across hierarchy and reference discovery."""
+        with TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir).resolve()
+            (root / "root.md").write_text("[a](a.md)\n[b](b.md)\n")
+            (root / "a.md").write_text("[b](b.md)\n")
+            (root / "b.md").write_text("# B")
+
+            exporter = VersionExporter()
+            file_contents: dict[str, str] = {}
+            with patch(
+                "promptic.versioning.domain.exporter.read_utf8_text",
+                side_effect=lambda path: Path(path).read_text(),
+            ) as read_mock:
+                exporter._build_hierarchical_paths(str(root / "root.md"), file_contents)
+                referenced = exporter.discover_referenced_files(
+                    str(root / "root.md"), root, file_contents
+                )
+
+            assert sorted(Path(p).name for p in referenced) == ["a.md", "b.md"]
+            assert sorted(Path(call.args[0]).name for call in read_mock.call_args_list) == [
+                "a.md",
+                "b.md",
+                "root.md",
+            ]
+
     def test_structure_preservation(self):
         """Test that export preserves hierarchical directory structure."""
         with TemporaryDirectory() as tmpdir:
@@ -288,6 +332,31 @@ class TestCreateContentProcessor:
 
             assert "World" in processed
 
+    @pytest.mark.parametrize(
+        "filename,expected",
+        [
+            ("root.md", "Hi {{ name }}!"),
+            ("root.txt", "Hi {{ name }}!"),
+            ("root.YML", "Hi {{ name }}!"),
+            ("root.jinja2", "Hi World!"),
+            ("root.Jinja", "Hi World!"),
+        ],
+    )
+    def test_processor_picks_substitution_format_by_suffix(self, filename, expected):
+        """Test only Jinja2 files are substituted with the Jinja2 engine."""
+        with TemporaryDirectory() as tmpdir:
+            source = Path(tmpdir)
+            root_file = source / filename
+            processor = VersionExporter()._create_content_processor(
+                file_mapping={},
+                source_base=str(source),
+                target=str(source / "export"),
+                vars={"name": "World"},
+                hierarchical_paths={},
+            )
+
+            assert processor(root_file, "Hi {{ name }}!") == expected
+
 
 class TestExecuteExport:
     """Test _execute_export method (T046)."""
@@ -0,0 +1,34 @@
+"""Unit tests for filesystem export adapter."""
+
+import pytest
+
+from promptic.versioning.adapters.filesystem_exporter import FileSystemExporter
+
+pytestmark = pytest.mark.unit
+
+
+class TestResolvePathsInFile:
+    """Test link rewriting in exported file content."""
+
+    def test_rewrites_mapped_links_and_keeps_others(self, tmp_path):
+        """Test local links to mapped files point at export targets; others are kept."""
+        source = tmp_path / "src"
+        target = tmp_path / "out"
+        mapping = {
+            str(source / "task_v1.md"): str(target / "task.md"),
+            str(source / "sub" / "../task_v1.md"): str(target / "duplicate.md"),
+            str(source / "sub" / "note_v2.md"): str(target / "sub" / "note.md"),
+        }
+        content = (
+            "[Task](task_v1.md) [Again](./task_v1.md) [Note](sub/note_v2.md)\n"
+            "[Missing](missing.md) [Web](https://example.com)"
+        )
+
+        result = FileSystemExporter().resolve_paths_in_file(
+            content, mapping, str(source), str(target)
+        )
+
+        assert result == (
+            "[Task](task.md) [Again](task.md) [Note](sub/note.md)\n"
+            "[Missing](missing.md) [Web](https://example.com)"
+        )
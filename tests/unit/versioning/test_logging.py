@@ -0,0 +1,50 @@
+"""Unit tests for versioning structured logging helpers."""
+
+import logging
+
+import pytest
+
+from promptic.versioning.utils.logging import log_version_operation
+
+pytestmark = pytest.mark.unit
+
+
+class _Unformattable:
+    def __str__(self) -> str:
+        raise AssertionError("disabled log records should not be formatted")
+
+
+class TestLogVersionOperation:
+    """Test log_version_operation helper."""
+
+    def test_levels_by_operation(self, caplog):
+        """Test operations are logged at their configured levels with structured fields."""
+        logger = logging.getLogger("promptic.tests.versioning_logging")
+        logger.setLevel(logging.DEBUG)
+
+        with caplog.at_level(logging.DEBUG, logger=logger.name):
+            log_version_operation(logger, "classifier_matched", path="a.md", lang="en")
+            log_version_operation(logger, "prerelease_only_warning", version="v1.0.0-beta")
+            log_version_operation(logger, "export_started", version="v1", path="p")
+
+        assert [(r.levelno, r.getMessage()) for r in caplog.records] == [
+            (
+                logging.DEBUG,
+                "Versioning operation: operation=classifier_matched, path=a.md, lang=en",
+            ),
+            (
+                logging.WARNING,
+                "Versioning operation: operation=prerelease_only_warning, version=v1.0.0-beta",
+            ),
+            (logging.INFO, "Versioning operation: operation=export_started, version=v1, path=p"),
+        ]
+
+    def test_disabled_level_skips_formatting(self, caplog):
+        """Test disabled operations return before formatting their fields."""
+        logger = logging.getLogger("promptic.tests.versioning_logging_info")
+        logger.setLevel(logging.INFO)
+
+        with caplog.at_level(logging.INFO, logger=logger.name):
+            log_version_operation(logger, "directory_scanned", path=_Unformattable())
+
+        assert caplog.records == []
@@ -83,6 +83,15 @@ class TestSemanticVersion:
         v2 = SemanticVersion(major=1, minor=1, patch=1)
         assert v1 < v2
 
+    def test_is_immutable_slotted_value(self):
+        """Test versions are hashable, immutable and carry no per-instance __dict__."""
+        version = SemanticVersion(major=1, minor=2, patch=3, prerelease="beta")
+
+        assert not hasattr(version, "__dict__")
+        assert {version: "x"}[SemanticVersion(1, 2, 3, "beta")] == "x"
+        with pytest.raises(AttributeError):
+            version.major = 2  # type: ignore[misc]
+
 
 class TestNormalizeVersion:
     """Test version normalization (T015)."""